@@ -28,72 +28,186 @@ symbolic reasoning and multi-brain orchestration. It serves as an example of
 how to interact with the abstract reasoning components.
 """
 
+from __future__ import annotations # Annotations stay lazy strings; typing names are only needed by checkers.
+
 import asyncio
+import logging as _stdlib_logging
 import structlog # Replaced logging with structlog
 import sys
-import os # os is imported but not used directly. Kept for now as it might be used implicitly by Path or for future use.
-from typing import Dict, Any, List, Optional # Added Optional
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
 # Initialize ΛTRACE logger for this demo script using structlog
 logger = structlog.get_logger("ΛTRACE.reasoning.abstract_reasoning_demo")
 logger.info("ΛTRACE: Initializing abstract_reasoning_demo.py script.", script_path=__file__)
 
+# Backing stdlib logger for the ΛTRACE hierarchy; its level is only known once logging has been configured.
+_TRACE_STDLIB_LOGGER = _stdlib_logging.getLogger("ΛTRACE")
+
+
+def _debug_enabled() -> bool:
+    """Checked at each call site (not at import) so filtered debug payloads never reach the structlog processor chain."""
+    return _TRACE_STDLIB_LOGGER.isEnabledFor(_stdlib_logging.DEBUG)
+
+
+# Stage-bound loggers are built once at import; each demo run only binds its request_id.
+_MAIN_LOGGER = logger.bind(demo_stage="main_reasoning_showcase")
+_ADV_LOGGER = logger.bind(demo_stage="advanced_features")
+_SCI_LOGGER = logger.bind(demo_stage="scientific_research")
+_BIZ_LOGGER = logger.bind(demo_stage="business_strategy")
+_DESIGN_LOGGER = logger.bind(demo_stage="creative_design")
+_RUN_ALL_LOGGER = logger.bind(demo_stage="full_suite_execution")
+
+
+# Section separators shared by every demo stage.
+_SEP30, _SEP40, _SEP60, _SEP70 = "=" * 30, "-" * 40, "=" * 60, "=" * 70
+
+
+def _make_request_id(prefix: str) -> str:
+    """Builds a millisecond-resolution request ID from the monotonic clock (one clock_gettime call)."""
+    return f"{prefix}_{time.monotonic_ns() // 1_000_000}"
+
+class _Trunc:
+    """Lazily truncated rendering of a log value; the str() cost is paid only if a renderer formats it."""
+    __slots__ = ("obj", "limit")
+
+    def __init__(self, obj: Any, limit: int) -> None:
+        self.obj, self.limit = obj, limit
+
+    def __str__(self) -> str:
+        return str(self.obj)[:self.limit]
+
+    __repr__ = __str__
+
 # --- Abstract Reasoning Brain Component Imports ---
 # TODO: Review path manipulation. For production, 'abstract_reasoning' should be an installable package
 #       or structured such that direct relative imports work without sys.path modification.
 #       This current method is fragile and depends on a specific directory structure.
+# The bootstrap is deferred to the first demo run so importing this module stays cheap.
 AbstractReasoningBrainInterface, reason_about = None, None # Placeholders
 AbstractReasoningBrainCore = None
 BioQuantumSymbolicReasoner, BrainSymphony = None, None
 AdvancedConfidenceCalibrator = None
+ABSTRACT_REASONING_COMPONENTS_AVAILABLE = False
+_COMPONENTS: Optional[Tuple[Any, Any, Any]] = None # (interface class, reason_about, core class) once loaded
 
-try:
-    current_script_path = Path(__file__).resolve()
-    project_root = current_script_path.parent.parent # Assumes reasoning/ is one level down from project root
-    abstract_reasoning_module_path = project_root / "abstract_reasoning"
-
-    if abstract_reasoning_module_path.exists() and str(abstract_reasoning_module_path) not in sys.path:
-        sys.path.insert(0, str(abstract_reasoning_module_path))
-        logger.info("ΛTRACE: Added abstract_reasoning module path to sys.path.",
-                    path_added=str(abstract_reasoning_module_path))
-
-    # Attempt to import components. Paths might need adjustment based on actual structure within abstract_reasoning
-    from interface import AbstractReasoningBrainInterface, reason_about
-    from core import AbstractReasoningBrainCore
-    # Assuming bio_quantum_engine and confidence_calibrator are submodules or files
-    from bio_quantum_engine import BioQuantumSymbolicReasoner, BrainSymphony
-    from confidence_calibrator import AdvancedConfidenceCalibrator
-
-    logger.info("ΛTRACE: Successfully imported components from 'abstract_reasoning' package.")
-    ABSTRACT_REASONING_COMPONENTS_AVAILABLE = True
-except ImportError as e:
-    logger.error("ΛTRACE: Failed to import Abstract Reasoning Brain components. Demo functionality will be limited.",
-                 error_message=str(e), attempted_path=str(abstract_reasoning_module_path), exc_info=True)
-    ABSTRACT_REASONING_COMPONENTS_AVAILABLE = False
-    # Define dummy classes/functions if import fails, allowing the script to be parsed/run with warnings.
-    class AbstractReasoningBrainInterface: # type: ignore
-        async def initialize(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.initialize"); pass
-        async def reason_abstractly(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.reason_abstractly"); return {"error": "dummy_interface_active"}
-        async def analyze_confidence(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.analyze_confidence"); return {}
-        async def orchestrate_brains(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.orchestrate_brains"); return {}
-        async def get_performance_summary(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.get_performance_summary"); return {}
-        async def provide_feedback(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.provide_feedback"); return {}
-        async def get_reasoning_history(self, *args: Any, **kwargs: Any) -> List[Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.get_reasoning_history"); return []
-        async def shutdown(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.shutdown"); pass
-
-    async def reason_about(*args: Any, **kwargs: Any) -> Dict[str, Any]: # type: ignore
-        logger.warning("ΛTRACE: Using dummy reason_about function.")
-        return {"error": "dummy_reason_about_active"}
-
-    class AbstractReasoningBrainCore: # type: ignore
-        async def activate_brain(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.activate_brain"); pass
-        async def process_independently(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.process_independently"); return {"error": "dummy_core_active"}
-        def get_brain_status(self) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.get_brain_status"); return {}
-        async def shutdown_brain(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.shutdown_brain"); pass
-
-    logger.warning("ΛTRACE: Using fallback dummy classes for Abstract Reasoning Brain components due to import failure. Demo may not function as intended.")
+
+def _load_components() -> Tuple[Any, Any, Any]:
+    """
+    Resolves the abstract_reasoning components on first call and caches them.
+    Falls back to dummy implementations when the package cannot be imported.
+    """
+    global AbstractReasoningBrainInterface, reason_about, AbstractReasoningBrainCore
+    global BioQuantumSymbolicReasoner, BrainSymphony, AdvancedConfidenceCalibrator
+    global ABSTRACT_REASONING_COMPONENTS_AVAILABLE, _COMPONENTS
+
+    if _COMPONENTS is not None:
+        return _COMPONENTS
+
+    abstract_reasoning_module_path = None
+    try:
+        current_script_path = Path(__file__).resolve()
+        project_root = current_script_path.parent.parent # Assumes reasoning/ is one level down from project root
+        abstract_reasoning_module_path = project_root / "abstract_reasoning"
+
+        if abstract_reasoning_module_path.exists() and str(abstract_reasoning_module_path) not in sys.path:
+            sys.path.insert(0, str(abstract_reasoning_module_path))
+            logger.info("ΛTRACE: Added abstract_reasoning module path to sys.path.",
+                        path_added=str(abstract_reasoning_module_path))
+
+        # Attempt to import components. Paths might need adjustment based on actual structure within abstract_reasoning
+        from interface import AbstractReasoningBrainInterface, reason_about
+        from core import AbstractReasoningBrainCore
+        # Assuming bio_quantum_engine and confidence_calibrator are submodules or files
+        from bio_quantum_engine import BioQuantumSymbolicReasoner, BrainSymphony
+        from confidence_calibrator import AdvancedConfidenceCalibrator
+
+        logger.info("ΛTRACE: Successfully imported components from 'abstract_reasoning' package.")
+        ABSTRACT_REASONING_COMPONENTS_AVAILABLE = True
+    except ImportError as e:
+        logger.error("ΛTRACE: Failed to import Abstract Reasoning Brain components. Demo functionality will be limited.",
+                     error_message=str(e), attempted_path=str(abstract_reasoning_module_path), exc_info=True)
+        ABSTRACT_REASONING_COMPONENTS_AVAILABLE = False
+        # Define dummy classes/functions if import fails, allowing the script to be parsed/run with warnings.
+        class AbstractReasoningBrainInterface: # type: ignore
+            async def initialize(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.initialize"); pass
+            async def reason_abstractly(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.reason_abstractly"); return {"error": "dummy_interface_active"}
+            async def analyze_confidence(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.analyze_confidence"); return {}
+            async def orchestrate_brains(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.orchestrate_brains"); return {}
+            async def get_performance_summary(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.get_performance_summary"); return {}
+            async def provide_feedback(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.provide_feedback"); return {}
+            async def get_reasoning_history(self, *args: Any, **kwargs: Any) -> List[Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.get_reasoning_history"); return []
+            async def shutdown(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainInterface.shutdown"); pass
+
+        async def reason_about(*args: Any, **kwargs: Any) -> Dict[str, Any]: # type: ignore
+            logger.warning("ΛTRACE: Using dummy reason_about function.")
+            return {"error": "dummy_reason_about_active"}
+
+        class AbstractReasoningBrainCore: # type: ignore
+            async def activate_brain(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.activate_brain"); pass
+            async def process_independently(self, *args: Any, **kwargs: Any) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.process_independently"); return {"error": "dummy_core_active"}
+            def get_brain_status(self) -> Dict[str, Any]: logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.get_brain_status"); return {}
+            async def shutdown_brain(self): logger.warning("ΛTRACE: Using dummy AbstractReasoningBrainCore.shutdown_brain"); pass
+
+        logger.warning("ΛTRACE: Using fallback dummy classes for Abstract Reasoning Brain components due to import failure. Demo may not function as intended.")
+
+    _COMPONENTS = (AbstractReasoningBrainInterface, reason_about, AbstractReasoningBrainCore)
+    return _COMPONENTS
+
+
+# One interface instance is shared by every demo so its initialize() cost is paid once per suite run.
+_shared_iface: Optional[Any] = None
+_iface_lock: Optional[asyncio.Lock] = None # Created on first use so it binds to the running event loop.
+_iface_users = 0 # Open _iface_session() blocks; the last one to exit shuts the interface down.
+
+
+async def _get_iface() -> Any:
+    """Returns the shared AbstractReasoningBrainInterface, initializing it on first call."""
+    global _shared_iface, _iface_lock
+    if _iface_lock is None:
+        _iface_lock = asyncio.Lock()
+    async with _iface_lock:
+        if _shared_iface is None:
+            iface_cls, _, _ = _load_components()
+            iface = iface_cls()
+            logger.info("ΛTRACE: Initializing shared AbstractReasoningBrainInterface...")
+            await iface.initialize()
+            logger.info("ΛTRACE: ✅ Abstract Reasoning Brain initialized successfully.")
+            _shared_iface = iface
+    return _shared_iface
+
+
+async def _shutdown_iface() -> None:
+    """Shuts down the shared interface if one was created."""
+    global _shared_iface
+    if _shared_iface is not None:
+        # Detached first so a session opened during shutdown initializes a fresh interface.
+        iface, _shared_iface = _shared_iface, None
+        logger.info("ΛTRACE: Attempting to shut down Abstract Reasoning Brain Interface...")
+        await iface.shutdown()
+        logger.info("ΛTRACE: 🛑 Abstract Reasoning Brain Interface shutdown sequence complete.")
+
+
+@asynccontextmanager
+async def _iface_session() -> AsyncIterator[Any]:
+    """
+    Yields the shared interface for the duration of a demo.
+    Sessions nest and overlap: the suite runner holds one around all demos, and a demo
+    called on its own shuts the interface down when it finishes.
+    """
+    global _iface_users
+    _iface_users += 1
+    try:
+        yield await _get_iface()
+    finally:
+        _iface_users -= 1
+        if _iface_users == 0:
+            await _shutdown_iface()
 
 
 # Main demonstration function for abstract reasoning capabilities.
@@ -104,120 +218,114 @@ async def demonstrate_abstract_reasoning() -> None:
     This function orchestrates several sub-demonstrations.
     """
     # Human-readable comment: Entry point for the main abstract reasoning demonstration sequence.
-    req_id_main_demo = f"demo_main_{int(datetime.utcnow().timestamp()*1000)}"
-    demo_logger = logger.bind(request_id=req_id_main_demo, demo_stage="main_reasoning_showcase")
+    req_id_main_demo = _make_request_id("demo_main")
+    req_id_ex1, req_id_ex1_conf, req_id_ex4 = f"{req_id_main_demo}_ex1", f"{req_id_main_demo}_ex1_conf", f"{req_id_main_demo}_ex4"
+    demo_logger = _MAIN_LOGGER.bind(request_id=req_id_main_demo)
+    iface_cls, reason_fn, _ = _load_components()
 
     demo_logger.info("ΛTRACE: Starting LUKHAS Bio-Quantum Symbolic Reasoning Engine Demo.")
     demo_logger.info("🧠⚛️ LUKHAS Bio-Quantum Symbolic Reasoning Engine Demo")
-    demo_logger.info("=" * 60)
+    demo_logger.info(_SEP60)
 
-    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not AbstractReasoningBrainInterface:
+    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not iface_cls:
         demo_logger.error("ΛTRACE: Abstract Reasoning Brain components are not available. Cannot run full demonstration.")
         return
 
-    reasoning_interface = AbstractReasoningBrainInterface()
-    demo_logger.info("ΛTRACE: Initializing AbstractReasoningBrainInterface...")
-    await reasoning_interface.initialize()
-    demo_logger.info("ΛTRACE: ✅ Abstract Reasoning Brain initialized successfully.")
-
-    try:
-        # Example 1: Simple Abstract Reasoning Problem
-        demo_logger.info(" ") # Adding a line break for readability in logs
-        demo_logger.info("🎯 Example 1: Simple Abstract Problem", example_id="ex1_simple_problem")
-        demo_logger.info("-" * 40)
-
-        simple_problem_data: Dict[str, Any] = {
-            "description": "How can we design a sustainable city that balances technology and nature effectively?",
-            "domain": "urban_planning_and_design",
-            "complexity_level": "medium", # Renamed for clarity
-            "key_constraints": ["environmental_sustainability", "technological_integration", "human_well_being", "economic_viability"], # Renamed
-        }
-        demo_logger.debug("ΛTRACE: Simple problem data defined.", problem_data=simple_problem_data)
+    async with _iface_session() as reasoning_interface:
+        try:
+            # Example 1: Simple Abstract Reasoning Problem
+            demo_logger.info(" ") # Adding a line break for readability in logs
+            demo_logger.info("🎯 Example 1: Simple Abstract Problem", example_id="ex1_simple_problem")
+            demo_logger.info(_SEP40)
+
+            simple_problem_data: Dict[str, Any] = {
+                "description": "How can we design a sustainable city that balances technology and nature effectively?",
+                "domain": "urban_planning_and_design",
+                "complexity_level": "medium", # Renamed for clarity
+                "key_constraints": ["environmental_sustainability", "technological_integration", "human_well_being", "economic_viability"], # Renamed
+            }
+            if _debug_enabled():
+                demo_logger.debug("ΛTRACE: Simple problem data defined.", problem_data=simple_problem_data)
+
+            result1 = await reasoning_interface.reason_abstractly(
+                problem_definition=simple_problem_data, # Renamed for clarity
+                reasoning_context={"urgency_level": "high", "involved_stakeholders": ["citizens", "government_agencies", "environmental_groups", "tech_innovators"]}, # Renamed
+                reasoning_mode="creative_holistic_problem_solving", # Renamed
+                request_id=req_id_ex1
+            )
+            demo_logger.info("ΛTRACE: Result for Example 1 (Simple Problem) received.", solution_id=result1.get('solution_id'))
+            demo_logger.info("🔍 Solution Confidence Score", confidence=result1.get('confidence_score', 0.0)) # Renamed
+            demo_logger.info("🎼 Brain Coherence Metric", coherence=result1.get('brain_coherence_metric', 0.0)) # Renamed
+
+            # Assuming the structure of 'result1' based on original logging
+            solution_details1 = result1.get('solution_details', {}) # Renamed
+            coherent_solution_package1 = solution_details1.get('coherent_solution_package', {}) # Renamed
+            reasoning_summary1 = coherent_solution_package1.get('reasoning_conclusion_summary', 'Analysis details not available.') # Renamed
+            demo_logger.info("💡 Solution Overview", overview=reasoning_summary1)
+
+            confidence_analysis1 = await reasoning_interface.analyze_confidence(reasoning_output=result1, request_id=req_id_ex1_conf) # Renamed
+            overall_interpretation1 = confidence_analysis1.get('full_confidence_interpretation', {}).get('overall_assessment', 'N/A') # Renamed
+            demo_logger.info("📊 Confidence Interpretation", interpretation=overall_interpretation1)
+
+            # Placeholder for actual content of further examples to keep this change focused.
+            # The pattern of updating log calls and variable names would continue.
+            demo_logger.info(" ")
+            demo_logger.info("🎯 Example 2: Complex Multi-Domain Problem (Placeholder Output)", example_id="ex2_complex_problem")
+            demo_logger.info(_SEP40)
+            # ... (Simulated call and logging for Example 2) ...
+            demo_logger.info("Complex problem analysis would be detailed here.")
 
-        result1 = await reasoning_interface.reason_abstractly(
-            problem_definition=simple_problem_data, # Renamed for clarity
-            reasoning_context={"urgency_level": "high", "involved_stakeholders": ["citizens", "government_agencies", "environmental_groups", "tech_innovators"]}, # Renamed
-            reasoning_mode="creative_holistic_problem_solving", # Renamed
-            request_id=f"{req_id_main_demo}_ex1"
-        )
-        demo_logger.info("ΛTRACE: Result for Example 1 (Simple Problem) received.", solution_id=result1.get('solution_id'))
-        demo_logger.info("🔍 Solution Confidence Score", confidence=result1.get('confidence_score', 0.0)) # Renamed
-        demo_logger.info("🎼 Brain Coherence Metric", coherence=result1.get('brain_coherence_metric', 0.0)) # Renamed
-
-        # Assuming the structure of 'result1' based on original logging
-        solution_details1 = result1.get('solution_details', {}) # Renamed
-        coherent_solution_package1 = solution_details1.get('coherent_solution_package', {}) # Renamed
-        reasoning_summary1 = coherent_solution_package1.get('reasoning_conclusion_summary', 'Analysis details not available.') # Renamed
-        demo_logger.info("💡 Solution Overview", overview=reasoning_summary1)
-
-        confidence_analysis1 = await reasoning_interface.analyze_confidence(reasoning_output=result1, request_id=f"{req_id_main_demo}_ex1_conf") # Renamed
-        overall_interpretation1 = confidence_analysis1.get('full_confidence_interpretation', {}).get('overall_assessment', 'N/A') # Renamed
-        demo_logger.info("📊 Confidence Interpretation", interpretation=overall_interpretation1)
-
-        # Placeholder for actual content of further examples to keep this change focused.
-        # The pattern of updating log calls and variable names would continue.
-        demo_logger.info(" ")
-        demo_logger.info("🎯 Example 2: Complex Multi-Domain Problem (Placeholder Output)", example_id="ex2_complex_problem")
-        demo_logger.info("-" * 40)
-        # ... (Simulated call and logging for Example 2) ...
-        demo_logger.info("Complex problem analysis would be detailed here.")
-
-        demo_logger.info(" ")
-        demo_logger.info("🎼 Example 3: Multi-Brain Orchestration (Placeholder Output)", example_id="ex3_orchestration")
-        demo_logger.info("-" * 40)
-        # ... (Simulated call and logging for Example 3) ...
-        demo_logger.info("Orchestration results and brain contributions would be shown here.")
-
-        # Example 4: Quick Reasoning with Convenience Function (if `reason_about` is available)
-        if reason_about:
             demo_logger.info(" ")
-            demo_logger.info("⚡ Example 4: Quick Reasoning Function", example_id="ex4_quick_reason")
-            demo_logger.info("-" * 40)
-            quick_problem = {"description": "Optimal path for drone delivery in a dynamic urban environment."}
-            quick_result = await reason_about(problem_data=quick_problem, context_info={"weather": "clear", "traffic": "moderate"}, request_id=f"{req_id_main_demo}_ex4")
-            demo_logger.info("Quick reasoning result", result_summary=str(quick_result)[:200])
+            demo_logger.info("🎼 Example 3: Multi-Brain Orchestration (Placeholder Output)", example_id="ex3_orchestration")
+            demo_logger.info(_SEP40)
+            # ... (Simulated call and logging for Example 3) ...
+            demo_logger.info("Orchestration results and brain contributions would be shown here.")
 
+            # Example 4: Quick Reasoning with Convenience Function (if `reason_about` is available)
+            if reason_fn:
+                demo_logger.info(" ")
+                demo_logger.info("⚡ Example 4: Quick Reasoning Function", example_id="ex4_quick_reason")
+                demo_logger.info(_SEP40)
+                quick_problem = {"description": "Optimal path for drone delivery in a dynamic urban environment."}
+                quick_result = await reason_fn(problem_data=quick_problem, context_info={"weather": "clear", "traffic": "moderate"}, request_id=req_id_ex4)
+                demo_logger.info("Quick reasoning result", result_summary=_Trunc(quick_result, 200))
 
-        demo_logger.info(" ")
-        demo_logger.info("📊 Example 5: Performance Summary (Placeholder Output)", example_id="ex5_performance")
-        demo_logger.info("-" * 40)
-        # ... (Simulated call and logging for Example 5) ...
-        demo_logger.info("Performance metrics and capabilities summary would be displayed here.")
 
-        demo_logger.info(" ")
-        demo_logger.info("📚 Example 6: Feedback Learning Demo (Placeholder Output)", example_id="ex6_feedback")
-        demo_logger.info("-" * 40)
-        # ... (Simulated call and logging for Example 6) ...
-        demo_logger.info("Feedback processing and reasoning history update would be demonstrated here.")
+            demo_logger.info(" ")
+            demo_logger.info("📊 Example 5: Performance Summary (Placeholder Output)", example_id="ex5_performance")
+            demo_logger.info(_SEP40)
+            # ... (Simulated call and logging for Example 5) ...
+            demo_logger.info("Performance metrics and capabilities summary would be displayed here.")
 
-    except Exception as e:
-        demo_logger.error("ΛTRACE: Main abstract reasoning demo failed with an error.", error_message=str(e), exc_info=True)
+            demo_logger.info(" ")
+            demo_logger.info("📚 Example 6: Feedback Learning Demo (Placeholder Output)", example_id="ex6_feedback")
+            demo_logger.info(_SEP40)
+            # ... (Simulated call and logging for Example 6) ...
+            demo_logger.info("Feedback processing and reasoning history update would be demonstrated here.")
 
-    finally:
-        demo_logger.info("ΛTRACE: Attempting to shut down Abstract Reasoning Brain Interface...")
-        if reasoning_interface : # Ensure it was initialized
-             await reasoning_interface.shutdown()
-        demo_logger.info("ΛTRACE: 🛑 Abstract Reasoning Brain Interface shutdown sequence complete.")
+        except Exception as e:
+            demo_logger.error("ΛTRACE: Main abstract reasoning demo failed with an error.", error_message=str(e), exc_info=True)
 
     demo_logger.info("🎉 Bio-Quantum Symbolic Reasoning Demo Complete!")
-    demo_logger.info("=" * 60)
+    demo_logger.info(_SEP60)
 
 # Demonstration of advanced features of the Bio-Quantum engine.
 async def demonstrate_advanced_features() -> None:
     """Demonstrates advanced features, including direct core access and detailed metrics if components are available."""
     # Human-readable comment: Showcases direct interaction with core components and advanced metrics.
-    req_id_adv_demo = f"demo_adv_{int(datetime.utcnow().timestamp()*1000)}"
-    adv_logger = logger.bind(request_id=req_id_adv_demo, demo_stage="advanced_features")
+    req_id_adv_demo = _make_request_id("demo_adv")
+    adv_logger = _ADV_LOGGER.bind(request_id=req_id_adv_demo)
+    _, _, core_cls = _load_components()
 
     adv_logger.info(" ")
     adv_logger.info("🔬 Starting Advanced Features Demo")
-    adv_logger.info("=" * 30)
+    adv_logger.info(_SEP30)
 
-    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not AbstractReasoningBrainCore:
+    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not core_cls:
         adv_logger.error("ΛTRACE: Abstract Reasoning Brain Core component is not available. Cannot run advanced features demonstration.")
         return
 
-    core_instance = AbstractReasoningBrainCore()
+    core_instance = core_cls()
     adv_logger.info("ΛTRACE: Activating AbstractReasoningBrainCore directly...")
     await core_instance.activate_brain()
     adv_logger.info("ΛTRACE: AbstractReasoningBrainCore activated.")
@@ -237,11 +345,13 @@ async def demonstrate_advanced_features() -> None:
             },
             "designated_reasoning_type": "quantum_algorithm_design_and_optimization", # Renamed
         }
-        adv_logger.debug("ΛTRACE: Advanced problem request data defined.", request_data=advanced_problem_request_data)
+        if _debug_enabled():
+            adv_logger.debug("ΛTRACE: Advanced problem request data defined.", request_data=advanced_problem_request_data)
 
         advanced_processing_result = await core_instance.process_independently(problem_data=advanced_problem_request_data, request_id=f"{req_id_adv_demo}_adv_proc") # Renamed
         adv_logger.info("ΛTRACE: Advanced processing results received from core.", result_keys=list(advanced_processing_result.keys()))
-        adv_logger.debug("ΛTRACE: Full advanced processing result.", result_data=advanced_processing_result)
+        if _debug_enabled():
+            adv_logger.debug("ΛTRACE: Full advanced processing result.", result_data=advanced_processing_result)
         # Example of logging specific parts of the result
         adv_logger.info("Algorithm Idea", idea=advanced_processing_result.get("proposed_algorithm_sketch", "N/A"))
         adv_logger.info("Core Confidence", confidence=advanced_processing_result.get("internal_confidence_metric", 0.0))
@@ -258,13 +368,14 @@ async def demonstrate_advanced_features() -> None:
 async def scientific_research_example() -> None:
     """Demonstrates using the abstract reasoning engine for scientific research hypothesis generation if components are available."""
     # Human-readable comment: Illustrates application in scientific hypothesis generation.
-    req_id = f"demo_sci_{int(datetime.utcnow().timestamp()*1000)}"
-    sci_logger = logger.bind(request_id=req_id, demo_stage="scientific_research")
+    req_id = _make_request_id("demo_sci")
+    sci_logger = _SCI_LOGGER.bind(request_id=req_id)
+    _load_components()
     sci_logger.info(" ")
     sci_logger.info("🔬 Starting Scientific Research Use Case Demo")
 
-    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not reason_about:
-        sci_logger.error("ΛTRACE: `reason_about` function not available. Skipping scientific research demo.")
+    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE:
+        sci_logger.error("ΛTRACE: Abstract reasoning interface not available. Skipping scientific research demo.")
         return
 
     research_problem_data: Dict[str, Any] = {
@@ -272,20 +383,22 @@ async def scientific_research_example() -> None:
         "domain": "quantum_biology_and_neuroscience",
         "existing_literature_keywords": ["Orch OR theory", "entanglement-like correlation in brain", "microtubules"]
     }
-    result = await reason_about(problem_data=research_problem_data, context_info={"research_level": "advanced_phd", "desired_novelty": "high"}, request_id=req_id)
-    sci_logger.info("Scientific research result", hypothesis_generated=result.get("hypothesis_statement", "N/A"), confidence=result.get('confidence_score',0.0))
+    async with _iface_session() as reasoning_interface:
+        result = await reasoning_interface.reason_abstractly(problem_definition=research_problem_data, reasoning_context={"research_level": "advanced_phd", "desired_novelty": "high"}, request_id=req_id)
+        sci_logger.info("Scientific research result", hypothesis_generated=result.get("hypothesis_statement", "N/A"), confidence=result.get('confidence_score',0.0))
 
 # Example of using the system for business strategy reasoning.
 async def business_strategy_example() -> None:
     """Demonstrates using the abstract reasoning engine for business strategy formulation if components are available."""
     # Human-readable comment: Illustrates application in formulating business strategies.
-    req_id = f"demo_biz_{int(datetime.utcnow().timestamp()*1000)}"
-    biz_logger = logger.bind(request_id=req_id, demo_stage="business_strategy")
+    req_id = _make_request_id("demo_biz")
+    biz_logger = _BIZ_LOGGER.bind(request_id=req_id)
+    _load_components()
     biz_logger.info(" ")
     biz_logger.info("💼 Starting Business Strategy Use Case Demo")
 
-    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not reason_about:
-        biz_logger.error("ΛTRACE: `reason_about` function not available. Skipping business strategy demo.")
+    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE:
+        biz_logger.error("ΛTRACE: Abstract reasoning interface not available. Skipping business strategy demo.")
         return
 
     strategy_problem_data: Dict[str, Any] = {
@@ -293,20 +406,22 @@ async def business_strategy_example() -> None:
         "domain": "business_strategy_and_innovation",
         "target_market_segment": "quantitative_hedge_funds"
     }
-    result = await reason_about(problem_data=strategy_problem_data, context_info={"industry_focus": "fintech_quant_trading", "time_horizon": "2_years"}, request_id=req_id)
-    biz_logger.info("Business strategy result", strategy_summary=result.get("strategy_overview", "N/A"), confidence=result.get('confidence_score',0.0))
+    async with _iface_session() as reasoning_interface:
+        result = await reasoning_interface.reason_abstractly(problem_definition=strategy_problem_data, reasoning_context={"industry_focus": "fintech_quant_trading", "time_horizon": "2_years"}, request_id=req_id)
+        biz_logger.info("Business strategy result", strategy_summary=result.get("strategy_overview", "N/A"), confidence=result.get('confidence_score',0.0))
 
 # Example of using the system for creative design reasoning.
 async def creative_design_example() -> None:
     """Demonstrates using the abstract reasoning engine for innovative creative design tasks if components are available."""
     # Human-readable comment: Illustrates application in creative design and innovation.
-    req_id = f"demo_design_{int(datetime.utcnow().timestamp()*1000)}"
-    design_logger = logger.bind(request_id=req_id, demo_stage="creative_design")
+    req_id = _make_request_id("demo_design")
+    design_logger = _DESIGN_LOGGER.bind(request_id=req_id)
+    _load_components()
     design_logger.info(" ")
     design_logger.info("🎨 Starting Creative Design Use Case Demo")
 
-    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE or not reason_about:
-        design_logger.error("ΛTRACE: `reason_about` function not available. Skipping creative design demo.")
+    if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE:
+        design_logger.error("ΛTRACE: Abstract reasoning interface not available. Skipping creative design demo.")
         return
 
     design_problem_data: Dict[str, Any] = {
@@ -314,49 +429,86 @@ async def creative_design_example() -> None:
         "domain": "human_computer_interaction_and_ux_design",
         "desired_features": ["seamless_integration", "minimal_cognitive_load", "adaptive_feedback"]
     }
-    result = await reason_about(problem_data=design_problem_data, context_info={"target_users": "creative_professionals_and_researchers", "technology_stack_preference": "webxr_pytorch"}, request_id=req_id)
-    design_logger.info("Creative design result", design_concept=result.get("design_concept_summary", "N/A"), confidence=result.get('confidence_score',0.0))
+    async with _iface_session() as reasoning_interface:
+        result = await reasoning_interface.reason_abstractly(problem_definition=design_problem_data, reasoning_context={"target_users": "creative_professionals_and_researchers", "technology_stack_preference": "webxr_pytorch"}, request_id=req_id)
+        design_logger.info("Creative design result", design_concept=result.get("design_concept_summary", "N/A"), confidence=result.get('confidence_score',0.0))
 
 # Main function to run all demonstration examples in sequence.
 async def run_all_demonstrations_sequentially() -> None: # Renamed for clarity
-    """Runs all defined demonstration examples for the abstract reasoning engine in sequence."""
+    """
+    Runs all defined demonstration examples for the abstract reasoning engine.
+    The core demos run in sequence; the independent use-case examples run concurrently.
+    """
     # Human-readable comment: Orchestrates the execution of all demo scenarios.
-    req_id_run_all = f"demo_run_all_{int(datetime.utcnow().timestamp()*1000)}"
-    run_all_logger = logger.bind(request_id=req_id_run_all, demo_stage="full_suite_execution")
+    req_id_run_all = _make_request_id("demo_run_all")
+    run_all_logger = _RUN_ALL_LOGGER.bind(request_id=req_id_run_all)
+    _load_components()
 
     run_all_logger.info("🚀 Starting Comprehensive Bio-Quantum Reasoning Demonstration Suite.")
-    run_all_logger.info("=" * 70)
+    run_all_logger.info(_SEP70)
 
     if not ABSTRACT_REASONING_COMPONENTS_AVAILABLE:
         run_all_logger.critical("ΛTRACE: Abstract reasoning components are not available. Full demonstration suite cannot run. Please check imports and paths.")
         return
 
-    await demonstrate_abstract_reasoning()
-    await demonstrate_advanced_features()
-    await scientific_research_example()
-    await business_strategy_example()
-    await creative_design_example()
+    # The suite's session keeps one interface up across every demo; it is shut down when the session closes.
+    async with _iface_session():
+        # The advanced demo owns its core, so the two core demos stay sequential.
+        await demonstrate_abstract_reasoning()
+        await demonstrate_advanced_features()
+
+        # The use-case examples are independent calls on the shared interface; overlap their latency.
+        use_case_demos = (scientific_research_example, business_strategy_example, creative_design_example)
+        use_case_results = await asyncio.gather(*(demo() for demo in use_case_demos), return_exceptions=True)
+        failed_demos = []
+        for demo, outcome in zip(use_case_demos, use_case_results):
+            if isinstance(outcome, Exception):
+                failed_demos.append(demo.__name__)
+                run_all_logger.error("ΛTRACE: Use-case demo failed.", demo_name=demo.__name__, error_message=str(outcome))
 
     run_all_logger.info(" ")
-    run_all_logger.info("🎯 All demonstrations completed successfully!")
+    if failed_demos:
+        run_all_logger.warning("⚠️ Demonstrations completed with failures.", failed_count=len(failed_demos), failed_demos=failed_demos)
+    else:
+        run_all_logger.info("🎯 All demonstrations completed successfully!")
     run_all_logger.info("🧠⚛️ The LUKHAS Bio-Quantum Symbolic Reasoning Engine demo is complete.")
-    run_all_logger.info("=" * 70)
+    run_all_logger.info(_SEP70)
 
 # Main execution block when the script is run directly.
 if __name__ == "__main__":
     # Human-readable comment: Script entry point for standalone execution.
     # Setup basic structlog logging for ΛTRACE if no handlers are configured (e.g., when running standalone)
     if not structlog.is_configured(): # Check if structlog is already configured
+        # Pretty console output for humans; JSON for pipes/CI, using orjson when it is installed.
+        if sys.stderr.isatty():
+            _renderer = structlog.dev.ConsoleRenderer(colors=True) # Recommended for dev
+        else:
+            try:
+                import orjson
+                _renderer = structlog.processors.JSONRenderer(
+                    serializer=lambda v, *, default: orjson.dumps(v, default=default).decode()
+                )
+            except ImportError:
+                _renderer = structlog.processors.JSONRenderer()
+        _PROCESSORS_DEV = [
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.StackInfoRenderer(),
+            structlog.dev.set_exc_info,
+            structlog.dev.format_exc_info,
+            # structlog.processors.format_ gọi # This was a typo, replaced with ConsoleRenderer
+            _renderer,
+        ]
+        # Production runs skip the frame-walking processors (StackInfoRenderer, set_exc_info) on every event.
+        _PROCESSORS_PROD = [
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            _renderer,
+        ]
+        import os # Only needed to read the log profile when run as a script.
+        _use_prod_processors = os.environ.get("LUKHAS_LOG_PROFILE", "").lower() in ("prod", "production")
         structlog.configure(
-            processors=[
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.processors.StackInfoRenderer(),
-                structlog.dev.set_exc_info,
-                structlog.dev.format_exc_info,
-                # structlog.processors.format_ gọi # This was a typo, replaced with ConsoleRenderer
-                structlog.dev.ConsoleRenderer(colors=True), # Recommended for dev
-            ],
+            processors=_PROCESSORS_PROD if _use_prod_processors else _PROCESSORS_DEV,
             logger_factory=structlog.stdlib.LoggerFactory(),
             wrapper_class=structlog.stdlib.BoundLogger, # Use BoundLogger for thread-local context
             cache_logger_on_first_use=True,
@@ -396,7 +548,8 @@ if __name__ == "__main__":
 #   - Direct interaction with core reasoning components.
 #   - Application examples in scientific research, business, and creative design.
 #
-# Dependencies: asyncio, structlog, sys, typing, pathlib, datetime,
+# Dependencies: asyncio, logging, structlog, sys, time, typing, pathlib,
+#               orjson (optional, for JSON log rendering),
 #               and components from the 'abstract_reasoning' package.
 #
 # Execution: Run as a standalone Python script. Requires the
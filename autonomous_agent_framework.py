@@ -11,17 +11,66 @@ This framework transforms Lambda Products into autonomous agents that can:
 """
 
 import asyncio
+import hashlib
+import itertools
 import logging
-from typing import Dict, Any, Optional, List, Callable
+import sys
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Callable, Tuple, Deque, Awaitable
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, field
 import json
-import uuid
+import os
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster state serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Cheap internal ids: a per-process prefix plus monotonic counters (no urandom per object)
+_ID_PREFIX = f"{os.getpid():x}"
+_GOAL_SEQ = itertools.count()
+_TASK_SEQ = itertools.count()
+
+# Slotted dataclasses drop the per-instance __dict__ (dataclass slots= needs Python 3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _install_eager_task_factory() -> None:
+    """Run new tasks eagerly up to their first suspension (Python 3.12+; no-op elsewhere)"""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(eager_task_factory)
+
+
+async def _run_blocking(func: Callable, *args) -> Any:
+    """Run a blocking call off the event loop (asyncio.to_thread on 3.9+, default executor before)"""
+    to_thread = getattr(asyncio, "to_thread", None)
+    if to_thread is not None:
+        return await to_thread(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _dump_state_bytes(state_data: Dict[str, Any]) -> bytes:
+    """Serialize agent state as indented JSON, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(state_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(state_data, indent=2).encode()
+
+
+def _write_state_file(state_file: Path, data: bytes) -> None:
+    """Blocking write of a serialized state file, creating its directory"""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    state_file.write_bytes(data)
+
 
 class AgentState(Enum):
     """Agent operational states"""
@@ -35,6 +84,15 @@ class AgentState(Enum):
     ERROR = "error"
 
 
+# States in which an agent is actively working (used for fleet queries)
+_ACTIVE_STATES = frozenset({
+    AgentState.PLANNING,
+    AgentState.EXECUTING,
+    AgentState.LEARNING,
+    AgentState.COLLABORATING
+})
+
+
 class AgentPriority(Enum):
     """Task priority levels for agents"""
     CRITICAL = 1
@@ -44,24 +102,36 @@ class AgentPriority(Enum):
     BACKGROUND = 5
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AgentGoal:
     """Represents a high-level goal for an agent"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: f"g{_ID_PREFIX}-{next(_GOAL_SEQ):x}")
     description: str = ""
     success_criteria: Dict[str, Any] = field(default_factory=dict)
     deadline: Optional[datetime] = None
     priority: AgentPriority = AgentPriority.NORMAL
     progress: float = 0.0
     completed: bool = False
+    # Last (fingerprint, progress) pair so unchanged criteria and metrics skip re-evaluation
+    _last_metrics_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _last_progress: float = field(default=0.0, init=False, repr=False, compare=False)
     
     def evaluate_progress(self, metrics: Dict[str, Any]) -> float:
         """Evaluate progress toward goal completion"""
-        if not self.success_criteria:
+        # Read live on every call: success_criteria is a public dict and may be updated after creation
+        criteria = self.success_criteria.items()
+        if not criteria:
             return 0.0
         
+        try:
+            fingerprint = hash(tuple((criterion, target, metrics.get(criterion)) for criterion, target in criteria))
+        except TypeError:  # Unhashable targets or metric values are evaluated every time
+            fingerprint = None
+        if fingerprint is not None and fingerprint == self._last_metrics_hash:
+            return self._last_progress
+        
         met_criteria = 0
-        for criterion, target in self.success_criteria.items():
+        for criterion, target in criteria:
             if criterion in metrics:
                 if isinstance(target, (int, float)):
                     if metrics[criterion] >= target:
@@ -69,13 +139,16 @@ class AgentGoal:
                 elif metrics[criterion] == target:
                     met_criteria += 1
         
-        return met_criteria / len(self.success_criteria) if self.success_criteria else 0.0
+        progress = met_criteria / len(criteria)
+        self._last_metrics_hash = fingerprint
+        self._last_progress = progress
+        return progress
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AgentTask:
     """Represents a specific task for an agent to execute"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: f"t{_ID_PREFIX}-{next(_TASK_SEQ):x}")
     goal_id: str = ""
     action: str = ""
     parameters: Dict[str, Any] = field(default_factory=dict)
@@ -86,6 +159,7 @@ class AgentTask:
     completed: bool = False
     result: Optional[Any] = None
     error: Optional[str] = None
+    parallel_safe: bool = False  # May join a concurrent batch regardless of priority
 
 
 class AutonomousAgent:
@@ -94,13 +168,23 @@ class AutonomousAgent:
     Implements Sam Altman's vision of AI agents in the workforce
     """
     
+    # Decomposed task templates shared across agents, keyed by a digest of the goal
+    _PLAN_CACHE: Dict[str, List[Dict[str, Any]]] = {}
+    
     def __init__(self, agent_id: str, agent_type: str):
         self.agent_id = agent_id
         self.agent_type = agent_type
         self.state = AgentState.INITIALIZING
         self.goals: List[AgentGoal] = []
-        self.task_queue: List[AgentTask] = []
-        self.completed_tasks: List[AgentTask] = []
+        # Entries are (priority, scheduled timestamp, insertion seq, task); seq breaks ties without comparing tasks
+        self.task_queue: "asyncio.PriorityQueue[Tuple[int, float, int, AgentTask]]" = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+        # Recent task history is capped; lifetime outcomes live in the counters below
+        self.completed_tasks: Deque[AgentTask] = deque(maxlen=1000)
+        self._archived_count = 0
+        self._success_count = 0
+        self._error_counts: Dict[str, int] = {}
+        self._tasks_since_learn = 0
         self.learning_memory: Dict[str, Any] = {}
         self.collaborators: Dict[str, 'AutonomousAgent'] = {}
         self.metrics: Dict[str, Any] = {
@@ -113,25 +197,31 @@ class AutonomousAgent:
         }
         self.is_running = False
         self.start_time = None
+        self._started_monotonic: Optional[float] = None  # Uptime clock, immune to wall-clock jumps
         self.last_human_interaction = datetime.now()
+        # Optional hook that runs a task on the agent's behalf (e.g. a shared worker pool)
+        self.task_executor: Optional[Callable[[AgentTask], Awaitable[Any]]] = None
         
     async def initialize(self, config: Dict[str, Any]) -> bool:
         """Initialize the agent with configuration"""
-        logger.info(f"Initializing {self.agent_type} agent: {self.agent_id}")
+        logger.info("Initializing %s agent: %s", self.agent_type, self.agent_id)
         
         self.config = config
         self.max_autonomous_days = config.get("max_autonomous_days", 7)
         self.decision_threshold = config.get("decision_threshold", 0.8)
         self.learning_rate = config.get("learning_rate", 0.1)
+        self.batch_size = config.get("batch_size", 8)
+        self.completed_tasks = deque(self.completed_tasks, maxlen=config.get("history_size", 1000))
         
         self.state = AgentState.IDLE
         self.start_time = datetime.now()
+        self._started_monotonic = time.monotonic()
         
         return True
     
     async def set_goal(self, goal: AgentGoal):
         """Set a high-level goal for the agent to achieve"""
-        logger.info(f"Agent {self.agent_id} received goal: {goal.description}")
+        logger.info("Agent %s received goal: %s", self.agent_id, goal.description)
         self.goals.append(goal)
         
         # Decompose goal into tasks
@@ -141,49 +231,72 @@ class AutonomousAgent:
     
     async def decompose_goal(self, goal: AgentGoal) -> List[AgentTask]:
         """Decompose a high-level goal into actionable tasks"""
+        key = self._plan_cache_key(goal)
+        templates = self._PLAN_CACHE.get(key)
+        if templates is None:
+            templates = self.plan_task_templates(goal)
+            self._PLAN_CACHE[key] = templates
+        
+        return [
+            AgentTask(
+                goal_id=goal.id,
+                action=tpl["action"],
+                parameters=dict(tpl["parameters"]),
+                priority=tpl["priority"]
+            )
+            for tpl in templates
+        ]
+    
+    def _plan_cache_key(self, goal: AgentGoal) -> str:
+        """Digest of the agent class and the goal fields that drive decomposition"""
+        criteria = json.dumps(goal.success_criteria, sort_keys=True, default=str)
+        raw = f"{type(self).__qualname__}|{goal.description.lower()}|{criteria}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    def plan_task_templates(self, goal: AgentGoal) -> List[Dict[str, Any]]:
+        """Rule-based decomposition into task templates (action, parameters, priority)"""
         # This is where GPT-5 integration would help
         # For now, use rule-based decomposition
-        tasks = []
+        templates = []
         
         # Example decomposition logic
         if "optimize" in goal.description.lower():
-            tasks.append(AgentTask(
-                goal_id=goal.id,
-                action="analyze_current_state",
-                parameters={"target": "performance_metrics"},
-                priority=AgentPriority.HIGH
-            ))
-            tasks.append(AgentTask(
-                goal_id=goal.id,
-                action="identify_bottlenecks",
-                parameters={"threshold": 0.7},
-                priority=AgentPriority.HIGH
-            ))
-            tasks.append(AgentTask(
-                goal_id=goal.id,
-                action="implement_optimizations",
-                parameters={"auto_approve": True},
-                priority=AgentPriority.NORMAL
-            ))
-        
-        return tasks
+            templates.append({
+                "action": "analyze_current_state",
+                "parameters": {"target": "performance_metrics"},
+                "priority": AgentPriority.HIGH
+            })
+            templates.append({
+                "action": "identify_bottlenecks",
+                "parameters": {"threshold": 0.7},
+                "priority": AgentPriority.HIGH
+            })
+            templates.append({
+                "action": "implement_optimizations",
+                "parameters": {"auto_approve": True},
+                "priority": AgentPriority.NORMAL
+            })
+        
+        return templates
     
     async def add_task(self, task: AgentTask):
         """Add a task to the agent's queue"""
-        self.task_queue.append(task)
-        # Sort by priority
-        self.task_queue.sort(key=lambda t: (t.priority.value, t.scheduled_time or datetime.max))
+        scheduled_ts = task.scheduled_time.timestamp() if task.scheduled_time else float("inf")
+        await self.task_queue.put((task.priority.value, scheduled_ts, next(self._seq), task))
     
     async def run(self):
         """Main autonomous execution loop"""
         self.is_running = True
-        logger.info(f"Agent {self.agent_id} starting autonomous operation")
+        logger.info("Agent %s starting autonomous operation", self.agent_id)
         
         while self.is_running:
             try:
+                # One wall-clock read per iteration, shared by the checks below
+                now = datetime.now()
+                
                 # Check if we've exceeded autonomous operation limit
-                if await self.should_request_human_input():
-                    await self.request_human_oversight()
+                if await self.should_request_human_input(now):
+                    await self.request_human_oversight(now)
                 
                 # Update state
                 await self.update_state()
@@ -202,22 +315,24 @@ class AutonomousAgent:
                     await self.learn_from_experience()
                 
                 elif self.state == AgentState.COLLABORATING:
-                    await self.collaborate_with_agents()
+                    if self.collaborators:
+                        await self.collaborate_with_agents()
                 
                 # Update metrics
                 await self.update_metrics()
                 
-                # Brief pause to prevent CPU overload
-                await asyncio.sleep(1)
+                # Yield straight back while work is pending; pause only when idle
+                work_pending = not self.task_queue.empty() and self.state in (AgentState.PLANNING, AgentState.EXECUTING)
+                await asyncio.sleep(0 if work_pending else 1)
                 
             except Exception as e:
-                logger.error(f"Agent {self.agent_id} encountered error: {e}")
+                logger.error("Agent %s encountered error: %s", self.agent_id, e)
                 self.state = AgentState.ERROR
                 await self.recover_from_error(e)
     
-    async def should_request_human_input(self) -> bool:
+    async def should_request_human_input(self, now: Optional[datetime] = None) -> bool:
         """Determine if human oversight is needed"""
-        time_since_human = datetime.now() - self.last_human_interaction
+        time_since_human = (now or datetime.now()) - self.last_human_interaction
         
         # Request human input if:
         # 1. Been running autonomously for too long
@@ -235,22 +350,22 @@ class AutonomousAgent:
         
         return False
     
-    async def request_human_oversight(self):
+    async def request_human_oversight(self, now: Optional[datetime] = None):
         """Request human oversight for critical decisions"""
-        logger.info(f"Agent {self.agent_id} requesting human oversight")
+        logger.info("Agent %s requesting human oversight", self.agent_id)
         self.state = AgentState.PAUSED
         # In production, this would send notifications
         # For now, just log
-        self.last_human_interaction = datetime.now()
+        self.last_human_interaction = now or datetime.now()
     
     async def update_state(self):
         """Update agent state based on current conditions"""
         if self.state == AgentState.ERROR:
             return
         
-        if self.task_queue and self.state == AgentState.IDLE:
+        if not self.task_queue.empty() and self.state == AgentState.IDLE:
             self.state = AgentState.PLANNING
-        elif not self.task_queue and self.goals:
+        elif self.task_queue.empty() and self.goals:
             self.state = AgentState.PLANNING
         elif self.should_learn():
             self.state = AgentState.LEARNING
@@ -258,7 +373,7 @@ class AutonomousAgent:
     def should_learn(self) -> bool:
         """Determine if agent should enter learning mode"""
         # Learn after every 10 completed tasks
-        return len(self.completed_tasks) % 10 == 0 and len(self.completed_tasks) > 0
+        return self._tasks_since_learn >= 10
     
     async def plan_next_action(self):
         """Plan the next action to take"""
@@ -278,40 +393,81 @@ class AutonomousAgent:
     async def execute_planning(self):
         """Execute planning phase"""
         # Move to execution if we have tasks
-        if self.task_queue:
+        if not self.task_queue.empty():
             self.state = AgentState.EXECUTING
         else:
             self.state = AgentState.IDLE
     
     async def execute_tasks(self):
-        """Execute tasks from the queue"""
-        if not self.task_queue:
+        """Execute a batch of ready tasks from the queue concurrently"""
+        try:
+            # Suspend until a producer hands over work instead of polling
+            head = (await asyncio.wait_for(self.task_queue.get(), timeout=1.0))[-1]
+        except asyncio.TimeoutError:
             self.state = AgentState.IDLE
             return
         
-        task = self.task_queue.pop(0)
+        batch = self._collect_task_batch(head)
+        run_task = self.task_executor or self.execute_single_task
+        outcomes = await asyncio.gather(
+            *(run_task(task) for task in batch),
+            return_exceptions=True
+        )
         
-        try:
-            # Execute the task
-            result = await self.execute_single_task(task)
-            task.result = result
-            task.completed = True
-            self.completed_tasks.append(task)
-            self.metrics["tasks_completed"] += 1
-            
-            logger.info(f"Agent {self.agent_id} completed task: {task.action}")
-            
-        except Exception as e:
-            task.error = str(e)
+        for task, outcome in zip(batch, outcomes):
+            await self._record_task_outcome(task, outcome)
+    
+    def _collect_task_batch(self, head: AgentTask) -> List[AgentTask]:
+        """Extend the head task with queued tasks that tie its priority or are parallel-safe"""
+        batch = [head]
+        
+        while not self.task_queue.empty() and len(batch) < self.batch_size:
+            entry = self.task_queue.get_nowait()
+            candidate = entry[-1]
+            if candidate.priority != head.priority and not candidate.parallel_safe:
+                # Same entry goes back, so its queue position is unchanged
+                self.task_queue.put_nowait(entry)
+                break
+            batch.append(candidate)
+        
+        return batch
+    
+    async def _record_task_outcome(self, task: AgentTask, outcome: Any):
+        """Merge a gathered result or exception back into its task"""
+        if isinstance(outcome, Exception):
+            task.error = str(outcome)
             task.retry_count += 1
             
             if task.retry_count < task.max_retries:
                 # Re-queue the task
                 await self.add_task(task)
-                logger.warning(f"Task {task.id} failed, retrying ({task.retry_count}/{task.max_retries})")
+                logger.warning("Task %s failed, retrying (%s/%s)", task.id, task.retry_count, task.max_retries)
             else:
-                logger.error(f"Task {task.id} failed after {task.max_retries} retries")
-                self.completed_tasks.append(task)
+                logger.error("Task %s failed after %s retries", task.id, task.max_retries)
+                self._archive_task(task)
+        
+        elif isinstance(outcome, BaseException):
+            # Cancellation and other non-Exception signals propagate as if awaited directly
+            raise outcome
+        
+        else:
+            task.result = outcome
+            task.completed = True
+            self._archive_task(task)
+            self.metrics["tasks_completed"] += 1
+            
+            logger.info("Agent %s completed task: %s", self.agent_id, task.action)
+    
+    def _archive_task(self, task: AgentTask):
+        """Record a finished task in the bounded history and the running outcome counters"""
+        self.completed_tasks.append(task)
+        self._archived_count += 1
+        self._tasks_since_learn += 1
+        if task.error:
+            error_type = task.error.split(":")[0]
+            self._error_counts[error_type] = self._error_counts.get(error_type, 0) + 1
+        else:
+            self._success_count += 1
     
     async def execute_single_task(self, task: AgentTask) -> Any:
         """Execute a single task - override in subclasses"""
@@ -323,18 +479,12 @@ class AutonomousAgent:
         """Learn from completed tasks to improve future performance"""
         self.state = AgentState.LEARNING
         
-        # Analyze completed tasks
-        success_rate = sum(1 for t in self.completed_tasks if not t.error) / len(self.completed_tasks)
+        # Analyze completed tasks from the running counters
+        success_rate = self._success_count / self._archived_count
         
         # Update learning memory
         self.learning_memory["success_rate"] = success_rate
-        self.learning_memory["common_errors"] = {}
-        
-        for task in self.completed_tasks:
-            if task.error:
-                error_type = task.error.split(":")[0]
-                self.learning_memory["common_errors"][error_type] = \
-                    self.learning_memory["common_errors"].get(error_type, 0) + 1
+        self.learning_memory["common_errors"] = dict(self._error_counts)
         
         # Adjust strategies based on learning
         if success_rate < 0.8:
@@ -342,8 +492,9 @@ class AutonomousAgent:
         else:
             self.decision_threshold = min(0.95, self.decision_threshold * 1.05)
         
-        logger.info(f"Agent {self.agent_id} learned: success_rate={success_rate:.2%}")
+        logger.info("Agent %s learned: success_rate=%.2f%%", self.agent_id, success_rate * 100)
         
+        self._tasks_since_learn = 0
         self.state = AgentState.IDLE
     
     async def collaborate_with_agents(self):
@@ -363,9 +514,8 @@ class AutonomousAgent:
     
     async def update_metrics(self):
         """Update agent metrics"""
-        if self.start_time:
-            uptime = datetime.now() - self.start_time
-            self.metrics["uptime_hours"] = uptime.total_seconds() / 3600
+        if self._started_monotonic is not None:
+            self.metrics["uptime_hours"] = (time.monotonic() - self._started_monotonic) / 3600
         
         # Calculate value generated (domain-specific)
         self.metrics["value_generated"] = self.calculate_value_generated()
@@ -379,11 +529,11 @@ class AutonomousAgent:
     
     async def recover_from_error(self, error: Exception):
         """Recover from an error state"""
-        logger.info(f"Agent {self.agent_id} recovering from error: {error}")
+        logger.info("Agent %s recovering from error: %s", self.agent_id, error)
         self.metrics["errors_recovered"] += 1
         
         # Clear current task queue
-        self.task_queue.clear()
+        self.task_queue = asyncio.PriorityQueue()
         
         # Reset to idle state
         self.state = AgentState.IDLE
@@ -392,18 +542,18 @@ class AutonomousAgent:
         self.learning_memory["last_error"] = str(error)
         self.learning_memory["error_timestamp"] = datetime.now().isoformat()
     
-    async def shutdown(self):
+    async def shutdown(self, persist_state: bool = True):
         """Gracefully shutdown the agent"""
-        logger.info(f"Shutting down agent {self.agent_id}")
+        logger.info("Shutting down agent %s", self.agent_id)
         self.is_running = False
         
         # Save state for resumption
-        await self.save_state()
+        if persist_state:
+            await self.save_state()
     
     async def save_state(self):
         """Save agent state for later resumption"""
         state_file = Path(f"data/agents/{self.agent_id}_state.json")
-        state_file.parent.mkdir(parents=True, exist_ok=True)
         
         state_data = {
             "agent_id": self.agent_id,
@@ -422,8 +572,8 @@ class AutonomousAgent:
             "last_save": datetime.now().isoformat()
         }
         
-        with open(state_file, "w") as f:
-            json.dump(state_data, f, indent=2)
+        # Serialize on the loop for a consistent snapshot; the file I/O runs in a worker thread
+        await _run_blocking(_write_state_file, state_file, _dump_state_bytes(state_data))
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
@@ -432,7 +582,7 @@ class AutonomousAgent:
             "agent_type": self.agent_type,
             "state": self.state.value,
             "goals_active": len([g for g in self.goals if not g.completed]),
-            "tasks_pending": len(self.task_queue),
+            "tasks_pending": self.task_queue.qsize(),
             "tasks_completed": self.metrics["tasks_completed"],
             "uptime_hours": self.metrics["uptime_hours"],
             "value_generated": self.metrics["value_generated"],
@@ -463,7 +613,7 @@ class AgentOrchestrator:
         # Start autonomous operation
         asyncio.create_task(agent.run())
         
-        logger.info(f"Deployed {agent.agent_type} agent: {agent.agent_id}")
+        logger.info("Deployed %s agent: %s", agent.agent_type, agent.agent_id)
     
     async def deploy_agent_fleet(self, agent_type: str, count: int, config: Dict[str, Any]):
         """Deploy a fleet of agents"""
@@ -474,40 +624,42 @@ class AgentOrchestrator:
     
     async def get_active_agents(self) -> List[AutonomousAgent]:
         """Get list of all active agents"""
-        active_agents = []
-        for agent in self.agents.values():
-            status = agent.get_status()  # get_status() is not async
-            if status.get("state") in ["running", "active", "processing"]:
-                active_agents.append(agent)
-        return active_agents
+        return [agent for agent in self.agents.values() if agent.state in _ACTIVE_STATES]
     
     async def shutdown_all_agents(self):
         """Shutdown all active agents"""
-        for agent in self.agents.values():
-            await agent.shutdown()
+        agents = list(self.agents.values())
+        results = await asyncio.gather(
+            *(agent.shutdown() for agent in agents),
+            return_exceptions=True
+        )
+        for agent, result in zip(agents, results):
+            if isinstance(result, Exception):
+                logger.error("Agent %s failed to shut down cleanly: %s", agent.agent_id, result)
         self.agents.clear()
         self.agent_pools.clear()
     
     def get_fleet_status(self) -> Dict[str, Any]:
         """Get status of entire agent fleet"""
+        # Single pass over the fleet for both totals and per-agent statuses
+        total_value_generated = 0
+        total_tasks_completed = 0
+        agents_status = []
+        for agent in self.agents.values():
+            metrics = agent.metrics
+            total_value_generated += metrics["value_generated"]
+            total_tasks_completed += metrics["tasks_completed"]
+            agents_status.append(agent.get_status())
+        
         return {
             "total_agents": len(self.agents),
             "agents_by_type": {
                 agent_type: len(agents)
                 for agent_type, agents in self.agent_pools.items()
             },
-            "total_value_generated": sum(
-                agent.metrics["value_generated"]
-                for agent in self.agents.values()
-            ),
-            "total_tasks_completed": sum(
-                agent.metrics["tasks_completed"]
-                for agent in self.agents.values()
-            ),
-            "agents_status": [
-                agent.get_status()
-                for agent in self.agents.values()
-            ]
+            "total_value_generated": total_value_generated,
+            "total_tasks_completed": total_tasks_completed,
+            "agents_status": agents_status
         }
     
     async def scale_fleet(self, agent_type: str, target_count: int):
@@ -533,6 +685,8 @@ class AgentOrchestrator:
 # Example usage for Lambda Products as Autonomous Agents
 if __name__ == "__main__":
     async def main():
+        _install_eager_task_factory()
+
         # Create orchestrator
         orchestrator = AgentOrchestrator()
         
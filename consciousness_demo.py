@@ -8,11 +8,14 @@ Copyright (c) 2025 Gonzalo R. Dominguez Marchan - LUKHΛS AI
 Licensed under LUKHΛS Proprietary License - Commercial use prohibited
 """
 
+import sys
 import time
 import math
 import random
+from bisect import bisect_left
+from functools import lru_cache
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 class ConsciousnessState(Enum):
     """LUKHΛS consciousness states"""
@@ -28,9 +31,46 @@ class ConsciousnessState(Enum):
         self.display_name = name
         self.intensity = intensity
 
+# States sorted by intensity once at import so selection is a bisect, not an Enum scan.
+# Keys are whole hundredths, so distances to neighbouring states compare exactly (no float rounding).
+_SORTED: Tuple[ConsciousnessState, ...] = tuple(sorted(ConsciousnessState, key=lambda s: s.intensity))
+_KEYS: Tuple[int, ...] = tuple(round(s.intensity * 100) for s in _SORTED)
+
+@lru_cache(maxsize=256)
+def _pick(hundredths: int) -> ConsciousnessState:
+    """Nearest state to an intensity given in hundredths; an exact midpoint (e.g. 20) goes to the lower state"""
+    i = bisect_left(_KEYS, hundredths)
+    if i == 0:
+        return _SORTED[0]
+    if i == len(_KEYS):
+        return _SORTED[-1]
+    if hundredths - _KEYS[i - 1] <= _KEYS[i] - hundredths:
+        return _SORTED[i - 1]
+    return _SORTED[i]
+
+# Dedicated generator for the demo; per-frame jitter is drawn from it in pooled batches
+_RNG = random.Random()
+_JITTER_POOL_SIZE = 1024
+
+# Static monitor chrome, built and UTF-8 encoded once instead of on every frame
+_CLEAR = b"\033[H\033[J"
+_TOP = ("╔" + "═"*58 + "╗").encode("utf-8")
+_MID = ("╠" + "═"*58 + "╣").encode("utf-8")
+_BOT = ("╚" + "═"*58 + "╝").encode("utf-8")
+_TITLE = ("║" + " LUKHΛS CONSCIOUSNESS STATE MONITOR".center(58) + "║").encode("utf-8")
+_BLANK = ("║" + " "*58 + "║").encode("utf-8")
+_BIO_HEADER = ("║ Bio-Rhythmic Patterns:".ljust(59) + "║").encode("utf-8")
+_METRICS_HEADER = ("║ System Metrics:".ljust(59) + "║").encode("utf-8")
+# Full-width bar fills; a bar of n cells is a prefix of one plus the matching suffix of the other
+_INTENSITY_FILL, _INTENSITY_EMPTY = "█"*30, "░"*30
+_METER_FILL, _METER_EMPTY = "▰"*20, "▱"*20
+
 class BioRhythm:
     """Simulates biological rhythms that influence consciousness"""
     
+    PERIOD = 100  # Time steps per full cycle; every integer frequency repeats within it
+    AMPLITUDES = {'gamma': 0.4, 'alpha': 0.3, 'theta': 0.2, 'delta': 0.1}  # Weights in the combined state
+    
     def __init__(self):
         self.time = 0
         self.frequencies = {
@@ -39,20 +79,30 @@ class BioRhythm:
             'theta': 4,     # Hz - Deep meditation/REM
             'delta': 1      # Hz - Deep sleep
         }
+        # Precomputed sine tables so per-frame waves are lookups, not trig calls
+        self._wave_tables = {
+            f: [math.sin(2 * math.pi * f * t / self.PERIOD) for t in range(self.PERIOD)]
+            for f in self.frequencies.values()
+        }
+        # The weighted four-wave sum is also periodic, so the clamped combined state is tabulated once too
+        self._combined_table = []
+        for t in range(self.PERIOD):
+            wave_sum = sum(
+                self.AMPLITUDES[band] * self._wave_tables[freq][t]
+                for band, freq in self.frequencies.items()
+            )
+            self._combined_table.append(max(0, min(1, (wave_sum + 1) / 2)))
     
     def get_wave(self, frequency: float, amplitude: float = 1.0) -> float:
         """Generate bio-rhythmic wave"""
-        return amplitude * math.sin(2 * math.pi * frequency * self.time / 100)
+        table = self._wave_tables.get(frequency)
+        if table is None:
+            return amplitude * math.sin(2 * math.pi * frequency * self.time / self.PERIOD)
+        return amplitude * table[self.time % self.PERIOD]
     
     def get_combined_state(self) -> float:
         """Get combined bio-rhythmic state (0-1)"""
-        gamma = self.get_wave(self.frequencies['gamma'], 0.4)
-        alpha = self.get_wave(self.frequencies['alpha'], 0.3)
-        theta = self.get_wave(self.frequencies['theta'], 0.2)
-        delta = self.get_wave(self.frequencies['delta'], 0.1)
-        
-        combined = (gamma + alpha + theta + delta + 1) / 2
-        return max(0, min(1, combined))
+        return self._combined_table[self.time % self.PERIOD]
     
     def advance(self):
         """Advance time"""
@@ -68,6 +118,23 @@ class LUKHASConsciousness:
         self.energy_level = 0.7
         self.memory_consolidation = 0.3
         self.state_history = []
+        self._jitter_pool = self._draw_jitter_pool()
+        self._jitter_i = 0
+    
+    @staticmethod
+    def _draw_jitter_pool() -> List[float]:
+        """Batch of organic-variation offsets in [-0.1, 0.1]"""
+        uniform = _RNG.uniform
+        return [uniform(-0.1, 0.1) for _ in range(_JITTER_POOL_SIZE)]
+    
+    def _next_jitter(self) -> float:
+        """Take the next pooled jitter value, refilling the pool when exhausted"""
+        if self._jitter_i == _JITTER_POOL_SIZE:
+            self._jitter_pool = self._draw_jitter_pool()
+            self._jitter_i = 0
+        jitter = self._jitter_pool[self._jitter_i]
+        self._jitter_i += 1
+        return jitter
         
     def calculate_next_state(self, stimulus: Optional[float] = None) -> ConsciousnessState:
         """Calculate next consciousness state based on bio-rhythms and stimuli"""
@@ -80,20 +147,11 @@ class LUKHASConsciousness:
             target_intensity = bio_state
         
         # Add some organic variation
-        target_intensity += random.uniform(-0.1, 0.1)
+        target_intensity += self._next_jitter()
         target_intensity = max(0, min(1, target_intensity))
         
         # Find closest consciousness state
-        best_state = ConsciousnessState.AWARE
-        min_diff = float('inf')
-        
-        for state in ConsciousnessState:
-            diff = abs(state.intensity - target_intensity)
-            if diff < min_diff:
-                min_diff = diff
-                best_state = state
-        
-        return best_state
+        return _pick(round(target_intensity * 100))
     
     def transition(self, new_state: ConsciousnessState):
         """Transition to new consciousness state"""
@@ -108,70 +166,71 @@ class LUKHASConsciousness:
     
     def visualize(self):
         """Visualize current consciousness state"""
-        # Clear previous visualization (in real terminal)
-        print("\033[H\033[J", end='')
-        
-        print("╔" + "═"*58 + "╗")
-        print("║" + " LUKHΛS CONSCIOUSNESS STATE MONITOR".center(58) + "║")
-        print("╠" + "═"*58 + "╣")
+        state = self.current_state
+        rhythm = self.bio_rhythm
         
         # Current state
-        state_line = f"{self.current_state.icon} {self.current_state.display_name}"
-        print("║ Current State: " + state_line.ljust(42) + "║")
+        state_line = f"{state.icon} {state.display_name}"
         
         # Intensity bar
-        intensity_bar = "█" * int(self.current_state.intensity * 30)
-        intensity_bar = intensity_bar.ljust(30, '░')
-        print(f"║ Intensity: [{intensity_bar}] {self.current_state.intensity:.2f} ║")
-        
-        # Bio-rhythms
-        print("║" + " "*58 + "║")
-        print("║ Bio-Rhythmic Patterns:".ljust(59) + "║")
-        
-        # Gamma wave (40Hz)
-        gamma_val = self.bio_rhythm.get_wave(40, 1.0)
-        gamma_bar = self._create_wave_bar(gamma_val)
-        print(f"║   Gamma (40Hz): {gamma_bar} Awareness   ║")
+        filled = int(state.intensity * 30)
+        intensity_bar = _INTENSITY_FILL[:filled] + _INTENSITY_EMPTY[filled:]
         
-        # Alpha wave (8Hz)
-        alpha_val = self.bio_rhythm.get_wave(8, 1.0)
-        alpha_bar = self._create_wave_bar(alpha_val)
-        print(f"║   Alpha (8Hz):  {alpha_bar} Relaxation  ║")
+        # Dynamic rows are formatted together and encoded in one call; static chrome is pre-encoded
+        state_rows = (
+            "║ Current State: " + state_line.ljust(42) + "║\n"
+            f"║ Intensity: [{intensity_bar}] {state.intensity:.2f} ║"
+        ).encode("utf-8")
         
-        # Theta wave (4Hz)
-        theta_val = self.bio_rhythm.get_wave(4, 1.0)
-        theta_bar = self._create_wave_bar(theta_val)
-        print(f"║   Theta (4Hz):  {theta_bar} Creativity  ║")
-        
-        # Delta wave (1Hz)
-        delta_val = self.bio_rhythm.get_wave(1, 1.0)
-        delta_bar = self._create_wave_bar(delta_val)
-        print(f"║   Delta (1Hz):  {delta_bar} Deep Process║")
+        # Bio-rhythms: gamma (40Hz), alpha (8Hz), theta (4Hz), delta (1Hz)
+        wave_rows = (
+            f"║   Gamma (40Hz): {self._create_wave_bar(rhythm.get_wave(40, 1.0))} Awareness   ║\n"
+            f"║   Alpha (8Hz):  {self._create_wave_bar(rhythm.get_wave(8, 1.0))} Relaxation  ║\n"
+            f"║   Theta (4Hz):  {self._create_wave_bar(rhythm.get_wave(4, 1.0))} Creativity  ║\n"
+            f"║   Delta (1Hz):  {self._create_wave_bar(rhythm.get_wave(1, 1.0))} Deep Process║"
+        ).encode("utf-8")
         
         # System metrics
-        print("║" + " "*58 + "║")
-        print("║ System Metrics:".ljust(59) + "║")
-        
-        attention_bar = "▰" * int(self.attention_focus * 20)
-        attention_bar = attention_bar.ljust(20, '▱')
-        print(f"║   Attention:    [{attention_bar}] {self.attention_focus:.2f} ║")
+        metric_rows = (
+            f"║   Attention:    [{self._meter(self.attention_focus)}] {self.attention_focus:.2f} ║\n"
+            f"║   Energy:       [{self._meter(self.energy_level)}] {self.energy_level:.2f} ║\n"
+            f"║   Memory Fold:  [{self._meter(self.memory_consolidation)}] {self.memory_consolidation:.2f} ║"
+        ).encode("utf-8")
         
-        energy_bar = "▰" * int(self.energy_level * 20)
-        energy_bar = energy_bar.ljust(20, '▱')
-        print(f"║   Energy:       [{energy_bar}] {self.energy_level:.2f} ║")
-        
-        memory_bar = "▰" * int(self.memory_consolidation * 20)
-        memory_bar = memory_bar.ljust(20, '▱')
-        print(f"║   Memory Fold:  [{memory_bar}] {self.memory_consolidation:.2f} ║")
-        
-        print("╚" + "═"*58 + "╝")
+        lines = [
+            _TOP, _TITLE, _MID, state_rows,
+            _BLANK, _BIO_HEADER, wave_rows,
+            _BLANK, _METRICS_HEADER, metric_rows,
+            _BOT
+        ]
         
         # State history
         if self.state_history:
-            print("\nRecent State Transitions:")
-            for state in self.state_history[-5:]:
-                print(f"  {state.icon} {state.display_name}", end=" → ")
-            print(f"{self.current_state.icon} {self.current_state.display_name}")
+            lines.append(b"\nRecent State Transitions:")
+            lines.append((
+                "".join(f"  {past.icon} {past.display_name} → " for past in self.state_history[-5:])
+                + f"{state.icon} {state.display_name}"
+            ).encode("utf-8"))
+        
+        # Clear previous visualization (in real terminal) and draw the frame as one byte blob
+        self._write_frame(_CLEAR + b"\n".join(lines) + b"\n")
+    
+    @staticmethod
+    def _write_frame(frame: bytes):
+        """Write an encoded frame straight to the binary stdout, bypassing the text encoder"""
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:  # e.g. stdout replaced by a text-only stream
+            sys.stdout.write(frame.decode("utf-8"))
+            return
+        sys.stdout.flush()  # Keep ordering with text already printed this frame
+        buffer.write(frame)
+        buffer.flush()
+    
+    @staticmethod
+    def _meter(value: float) -> str:
+        """20-cell meter for a 0-1 system metric"""
+        filled = int(value * 20)
+        return _METER_FILL[:filled] + _METER_EMPTY[filled:]
     
     def _create_wave_bar(self, value: float) -> str:
         """Create visual representation of wave value"""
@@ -220,7 +279,7 @@ def run_demo():
                 break
             elif user_input == 's':
                 # Apply random stimulus
-                stimulus = random.uniform(0.3, 1.0)
+                stimulus = _RNG.uniform(0.3, 1.0)
                 print(f"⚡ Applying stimulus: {stimulus:.2f}")
                 new_state = consciousness.calculate_next_state(stimulus)
                 time.sleep(0.5)
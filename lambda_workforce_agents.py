@@ -11,13 +11,22 @@ These are specialized autonomous agents built on Lambda Products that can:
 """
 
 import asyncio
+import functools
+from array import array
+from collections import deque
 import logging
+import os
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
 import random
+import time
+import types
+from dataclasses import dataclass
+from enum import IntEnum
 
 from .autonomous_agent_framework import (
+    _install_eager_task_factory,
     AutonomousAgent,
     AgentGoal,
     AgentTask,
@@ -27,8 +36,121 @@ from .autonomous_agent_framework import (
 
 logger = logging.getLogger(__name__)
 
+# [monotonic stamp, ISO string] of the last wall-clock read used for record timestamps
+_NOW_ISO_CACHE = [float("-inf"), ""]
 
-class NIASEmotionalIntelligenceAgent(AutonomousAgent):
+
+def _now_iso() -> str:
+    """Current local time in ISO format, re-read from the clock at most every 0.5s"""
+    mono = time.monotonic()
+    if mono - _NOW_ISO_CACHE[0] >= 0.5:
+        _NOW_ISO_CACHE[0] = mono
+        _NOW_ISO_CACHE[1] = datetime.now().isoformat()
+    return _NOW_ISO_CACHE[1]
+
+
+def _sync_handler(func):
+    """Declare a task handler that never awaits: callers still await it, dispatch calls the plain function"""
+    @functools.wraps(func)
+    async def facade(self, params):
+        return func(self, params)
+    facade.sync = func
+    return facade
+
+
+def _sync_handlers(dispatch: Dict[str, Any]) -> Dict[str, Any]:
+    """Bound synchronous bodies for the dispatch entries declared with @_sync_handler"""
+    return {
+        action: types.MethodType(handler.sync, handler.__self__)
+        for action, handler in dispatch.items()
+        if hasattr(handler, "sync")
+    }
+
+
+# Fixed section of every executive report
+_FUTURE_RECOMMENDATIONS = (
+    "Deploy additional ΛBAS agents for Q2 planning",
+    "Integrate with GPT-5 for enhanced decision making",
+    "Expand to customer service with NIΛS agents",
+    "Implement predictive hiring with DΛST"
+)
+
+class AgentKind(IntEnum):
+    """Lambda product behind a workforce agent"""
+    NIAS = 0  # NIΛS
+    ABAS = 1  # ΛBAS
+    DAST = 2  # DΛST
+
+
+# Cost of agents (subscription model) by AgentKind; any other agent is billed at the default
+_MONTHLY_COST_BY_KIND = {
+    AgentKind.NIAS: 5000,  # $5K/month per agent
+    AgentKind.ABAS: 8000,  # $8K/month per agent
+    AgentKind.DAST: 6000   # $6K/month per agent
+}
+_DEFAULT_MONTHLY_COST = 5000
+
+# Constant option sets for the simulated agent telemetry, built once at import
+_RISK_LEVELS = ("low", "medium", "high")
+_RECOMMENDED_ACTIONS = (
+    "schedule_break",
+    "reduce_workload",
+    "team_support",
+    "manager_checkin"
+)
+_BURNOUT_FACTORS = (
+    "overtime_hours",
+    "missed_breaks",
+    "high_stress_projects",
+    "poor_work_life_balance",
+    "team_conflicts"
+)
+_BURNOUT_PREVENTION_ACTIONS = (
+    "mandatory_time_off",
+    "workload_redistribution",
+    "wellness_program_enrollment"
+)
+_WELLNESS_COMPONENTS = (
+    "meditation_sessions",
+    "flexible_hours",
+    "mental_health_resources",
+    "team_building_activities",
+    "workload_adjustment",
+    "coaching_sessions"
+)
+_DISTRACTION_SOURCES = (
+    "unnecessary_notifications",
+    "non_critical_emails",
+    "social_media",
+    "irrelevant_meetings",
+    "context_switching",
+    "open_office_noise"
+)
+
+
+class _ProductAgent(AutonomousAgent):
+    """Workforce agent whose task actions are served from a per-agent handler table"""
+    
+    def _set_handlers(self, dispatch: Dict[str, Any]):
+        """Install the task action -> handler table, resolved once instead of an if/elif chain per task"""
+        self._dispatch = dispatch
+        self._sync_dispatch = _sync_handlers(dispatch)
+    
+    async def execute_single_task(self, task: AgentTask) -> Any:
+        """Execute a product task through the handler table, falling back to the generic agent"""
+        
+        sync_handler = self._sync_dispatch.get(task.action)
+        if sync_handler is not None:
+            return sync_handler(task.parameters)
+        
+        handler = self._dispatch.get(task.action)
+        if handler is not None:
+            return await handler(task.parameters)
+        
+        return await super().execute_single_task(task)
+
+
+class NIASEmotionalIntelligenceAgent(_ProductAgent):
     """
     NIΛS Agent - Autonomous Emotional Intelligence Manager
     Manages company-wide emotional well-being without human intervention
@@ -37,66 +159,65 @@ class NIASEmotionalIntelligenceAgent(AutonomousAgent):
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, "NIΛS_Emotional_Intelligence")
+        self.kind = AgentKind.NIAS
+        self._rng = random.Random()  # Per-agent generator for simulated telemetry
         self.employee_profiles = {}
         self.emotional_patterns = {}
-        self.intervention_history = []
-        
-    async def execute_single_task(self, task: AgentTask) -> Any:
-        """Execute NIΛS-specific tasks"""
-        
-        if task.action == "monitor_emotional_state":
-            return await self.monitor_emotional_state(task.parameters)
-        
-        elif task.action == "detect_burnout_risk":
-            return await self.detect_burnout_risk(task.parameters)
-        
-        elif task.action == "optimize_communication_timing":
-            return await self.optimize_communication_timing(task.parameters)
-        
-        elif task.action == "create_wellness_intervention":
-            return await self.create_wellness_intervention(task.parameters)
-        
-        elif task.action == "manage_team_dynamics":
-            return await self.manage_team_dynamics(task.parameters)
-        
-        return await super().execute_single_task(task)
-    
-    async def monitor_emotional_state(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Bounded ring buffer: agents run unattended for days, so only the newest interventions are kept
+        self.intervention_history = deque(maxlen=100_000)
+        # Pre-drawn random bytes, consumed 8 at a time by the per-employee monitoring loop
+        self._entropy = memoryview(bytearray(os.urandom(4096)))
+        self._entropy_off = 0
+        self._set_handlers({
+            "monitor_emotional_state": self.monitor_emotional_state,
+            "detect_burnout_risk": self.detect_burnout_risk,
+            "optimize_communication_timing": self.optimize_communication_timing,
+            "create_wellness_intervention": self.create_wellness_intervention,
+            "manage_team_dynamics": self.manage_team_dynamics
+        })
+        
+    @_sync_handler
+    def monitor_emotional_state(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Monitor emotional state across the organization"""
         
         # Simulate monitoring (in production, would integrate with real systems)
         employees_monitored = params.get("employee_count", 100)
         
         emotional_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "employees_analyzed": employees_monitored,
-            "average_stress_level": random.uniform(0.3, 0.7),
-            "average_satisfaction": random.uniform(0.6, 0.9),
-            "burnout_risk_count": random.randint(5, 20),
+            "average_stress_level": self._rng.uniform(0.3, 0.7),
+            "average_satisfaction": self._rng.uniform(0.6, 0.9),
+            "burnout_risk_count": self._rng.randint(5, 20),
             "intervention_needed": []
         }
         
-        # Identify employees needing intervention
-        for i in range(random.randint(1, 10)):
+        # Identify employees needing intervention; each draws all its fields from one 64-bit word:
+        # bits 0-15 pick the risk level, bits 16-17 the action, bits 20+ the employee id
+        entropy = self._entropy
+        off = self._entropy_off
+        for i in range(self._rng.randint(1, 10)):
+            if off == len(entropy):
+                entropy[:] = os.urandom(len(entropy))
+                off = 0
+            word = int.from_bytes(entropy[off:off + 8], "little")
+            off += 8
             emotional_data["intervention_needed"].append({
-                "employee_id": f"emp_{random.randint(1000, 9999)}",
-                "risk_level": random.choice(["low", "medium", "high"]),
-                "recommended_action": random.choice([
-                    "schedule_break",
-                    "reduce_workload",
-                    "team_support",
-                    "manager_checkin"
-                ])
+                "employee_id": f"emp_{1000 + (word >> 20) % 9000}",
+                "risk_level": _RISK_LEVELS[(word & 0xFFFF) % 3],
+                "recommended_action": _RECOMMENDED_ACTIONS[(word >> 16) & 3]
             })
+        self._entropy_off = off
         
         # Update metrics
         self.metrics["decisions_made"] += len(emotional_data["intervention_needed"])
         
-        logger.info(f"NIΛS Agent monitored {employees_monitored} employees")
+        logger.info("NIΛS Agent monitored %s employees", employees_monitored)
         
         return emotional_data
     
-    async def detect_burnout_risk(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def detect_burnout_risk(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Detect and prevent employee burnout"""
         
         threshold = params.get("risk_threshold", 0.7)
@@ -104,37 +225,33 @@ class NIASEmotionalIntelligenceAgent(AutonomousAgent):
         # Analyze patterns (simulated)
         at_risk_employees = []
         
-        for i in range(random.randint(5, 15)):
-            risk_score = random.uniform(0.5, 1.0)
+        # Draw every candidate's risk score in one batch, then keep those above threshold
+        uniform = self._rng.uniform
+        risk_scores = [uniform(0.5, 1.0) for _ in range(self._rng.randint(5, 15))]
+        
+        for risk_score in risk_scores:
             if risk_score > threshold:
                 at_risk_employees.append({
-                    "employee_id": f"emp_{random.randint(1000, 9999)}",
+                    "employee_id": f"emp_{self._rng.randint(1000, 9999)}",
                     "risk_score": risk_score,
-                    "factors": random.sample([
-                        "overtime_hours",
-                        "missed_breaks",
-                        "high_stress_projects",
-                        "poor_work_life_balance",
-                        "team_conflicts"
-                    ], k=random.randint(2, 4)),
+                    "factors": self._rng.sample(_BURNOUT_FACTORS, k=self._rng.randint(2, 4)),
                     "intervention": {
                         "type": "preventive",
-                        "actions": [
-                            "mandatory_time_off",
-                            "workload_redistribution",
-                            "wellness_program_enrollment"
-                        ]
+                        "actions": _BURNOUT_PREVENTION_ACTIONS
                     }
                 })
         
-        # Take autonomous action
-        for employee in at_risk_employees:
-            self.intervention_history.append({
-                "timestamp": datetime.now().isoformat(),
+        # Take autonomous action, then log the whole batch with a single extend
+        timestamp = _now_iso()
+        self.intervention_history.extend([
+            {
+                "timestamp": timestamp,
                 "employee_id": employee["employee_id"],
                 "action_taken": "burnout_prevention",
                 "autonomous": True
-            })
+            }
+            for employee in at_risk_employees
+        ])
         
         self.metrics["value_generated"] += len(at_risk_employees) * 10000  # $10K value per prevented burnout
         
@@ -144,23 +261,25 @@ class NIASEmotionalIntelligenceAgent(AutonomousAgent):
             "estimated_value_saved": len(at_risk_employees) * 10000
         }
     
-    async def optimize_communication_timing(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def optimize_communication_timing(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize when messages are delivered based on emotional state"""
         
-        messages_optimized = random.randint(100, 500)
+        messages_optimized = self._rng.randint(100, 500)
         
         optimization_results = {
             "messages_rescheduled": messages_optimized,
-            "stress_reduction": random.uniform(0.15, 0.35),
-            "engagement_increase": random.uniform(0.20, 0.45),
-            "productivity_gain": random.uniform(0.10, 0.25)
+            "stress_reduction": self._rng.uniform(0.15, 0.35),
+            "engagement_increase": self._rng.uniform(0.20, 0.45),
+            "productivity_gain": self._rng.uniform(0.10, 0.25)
         }
         
         self.metrics["value_generated"] += messages_optimized * 50  # $50 value per optimized communication
         
         return optimization_results
     
-    async def create_wellness_intervention(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def create_wellness_intervention(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create personalized wellness interventions"""
         
         intervention_type = params.get("type", "general")
@@ -168,20 +287,13 @@ class NIASEmotionalIntelligenceAgent(AutonomousAgent):
         intervention = {
             "id": f"intervention_{datetime.now().timestamp()}",
             "type": intervention_type,
-            "created_at": datetime.now().isoformat(),
-            "target_employees": random.randint(10, 50),
-            "components": random.sample([
-                "meditation_sessions",
-                "flexible_hours",
-                "mental_health_resources",
-                "team_building_activities",
-                "workload_adjustment",
-                "coaching_sessions"
-            ], k=random.randint(3, 5)),
+            "created_at": _now_iso(),
+            "target_employees": self._rng.randint(10, 50),
+            "components": self._rng.sample(_WELLNESS_COMPONENTS, k=self._rng.randint(3, 5)),
             "expected_impact": {
-                "stress_reduction": random.uniform(0.20, 0.40),
-                "satisfaction_increase": random.uniform(0.15, 0.35),
-                "retention_improvement": random.uniform(0.10, 0.25)
+                "stress_reduction": self._rng.uniform(0.20, 0.40),
+                "satisfaction_increase": self._rng.uniform(0.15, 0.35),
+                "retention_improvement": self._rng.uniform(0.10, 0.25)
             }
         }
         
@@ -189,17 +301,18 @@ class NIASEmotionalIntelligenceAgent(AutonomousAgent):
         
         return intervention
     
-    async def manage_team_dynamics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def manage_team_dynamics(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Manage and optimize team dynamics"""
         
         teams_analyzed = params.get("team_count", 10)
         
         dynamics_report = {
             "teams_optimized": teams_analyzed,
-            "conflicts_resolved": random.randint(2, 8),
-            "collaboration_improvement": random.uniform(0.20, 0.45),
-            "team_satisfaction": random.uniform(0.70, 0.90),
-            "recommendations_implemented": random.randint(15, 30)
+            "conflicts_resolved": self._rng.randint(2, 8),
+            "collaboration_improvement": self._rng.uniform(0.20, 0.45),
+            "team_satisfaction": self._rng.uniform(0.70, 0.90),
+            "recommendations_implemented": self._rng.randint(15, 30)
         }
         
         self.metrics["value_generated"] += teams_analyzed * 15000  # $15K value per optimized team
@@ -207,7 +320,7 @@ class NIASEmotionalIntelligenceAgent(AutonomousAgent):
         return dynamics_report
 
 
-class ABASProductivityOptimizerAgent(AutonomousAgent):
+class ABASProductivityOptimizerAgent(_ProductAgent):
     """
     ΛBAS Agent - Autonomous Attention & Productivity Optimizer
     Manages company-wide attention resources and flow states
@@ -216,119 +329,104 @@ class ABASProductivityOptimizerAgent(AutonomousAgent):
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, "ΛBAS_Productivity_Optimizer")
+        self.kind = AgentKind.ABAS
+        self._rng = random.Random()  # Per-agent generator for simulated telemetry
         self.flow_states = {}
         self.distraction_patterns = {}
         self.productivity_metrics = {}
-        
-    async def execute_single_task(self, task: AgentTask) -> Any:
-        """Execute ΛBAS-specific tasks"""
-        
-        if task.action == "optimize_meeting_schedule":
-            return await self.optimize_meeting_schedule(task.parameters)
-        
-        elif task.action == "protect_flow_states":
-            return await self.protect_flow_states(task.parameters)
-        
-        elif task.action == "eliminate_distractions":
-            return await self.eliminate_distractions(task.parameters)
-        
-        elif task.action == "optimize_workspace":
-            return await self.optimize_workspace(task.parameters)
-        
-        elif task.action == "manage_cognitive_load":
-            return await self.manage_cognitive_load(task.parameters)
-        
-        return await super().execute_single_task(task)
-    
-    async def optimize_meeting_schedule(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._set_handlers({
+            "optimize_meeting_schedule": self.optimize_meeting_schedule,
+            "protect_flow_states": self.protect_flow_states,
+            "eliminate_distractions": self.eliminate_distractions,
+            "optimize_workspace": self.optimize_workspace,
+            "manage_cognitive_load": self.manage_cognitive_load
+        })
+        
+    @_sync_handler
+    def optimize_meeting_schedule(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize meeting schedules for maximum productivity"""
         
         meetings_analyzed = params.get("meeting_count", 50)
         
         optimization = {
-            "meetings_eliminated": random.randint(10, 20),
-            "meetings_shortened": random.randint(15, 25),
-            "meetings_rescheduled": random.randint(20, 30),
-            "time_saved_hours": random.randint(50, 150),
-            "productivity_gain": random.uniform(0.25, 0.45),
-            "employee_satisfaction": random.uniform(0.75, 0.95)
+            "meetings_eliminated": self._rng.randint(10, 20),
+            "meetings_shortened": self._rng.randint(15, 25),
+            "meetings_rescheduled": self._rng.randint(20, 30),
+            "time_saved_hours": self._rng.randint(50, 150),
+            "productivity_gain": self._rng.uniform(0.25, 0.45),
+            "employee_satisfaction": self._rng.uniform(0.75, 0.95)
         }
         
         # Calculate value generated
         hourly_rate = 150  # Average enterprise employee hourly rate
         self.metrics["value_generated"] += optimization["time_saved_hours"] * hourly_rate
         
-        logger.info(f"ΛBAS Agent optimized {meetings_analyzed} meetings, saved {optimization['time_saved_hours']} hours")
+        logger.info("ΛBAS Agent optimized %s meetings, saved %s hours", meetings_analyzed, optimization["time_saved_hours"])
         
         return optimization
     
-    async def protect_flow_states(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def protect_flow_states(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Protect employee flow states from interruptions"""
         
         employees_protected = params.get("employee_count", 100)
         
         protection_results = {
-            "flow_sessions_protected": random.randint(200, 500),
-            "interruptions_blocked": random.randint(1000, 3000),
-            "deep_work_hours_gained": random.randint(100, 300),
-            "quality_improvement": random.uniform(0.30, 0.50),
-            "error_reduction": random.uniform(0.20, 0.40)
+            "flow_sessions_protected": self._rng.randint(200, 500),
+            "interruptions_blocked": self._rng.randint(1000, 3000),
+            "deep_work_hours_gained": self._rng.randint(100, 300),
+            "quality_improvement": self._rng.uniform(0.30, 0.50),
+            "error_reduction": self._rng.uniform(0.20, 0.40)
         }
         
         self.metrics["value_generated"] += protection_results["deep_work_hours_gained"] * 200
         
         return protection_results
     
-    async def eliminate_distractions(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def eliminate_distractions(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Eliminate workplace distractions autonomously"""
         
-        distraction_sources = [
-            "unnecessary_notifications",
-            "non_critical_emails",
-            "social_media",
-            "irrelevant_meetings",
-            "context_switching",
-            "open_office_noise"
-        ]
-        
         elimination_report = {
-            "distractions_identified": len(distraction_sources),
-            "distractions_eliminated": random.randint(3, 5),
-            "focus_time_increase": random.uniform(0.35, 0.55),
-            "productivity_boost": random.uniform(0.25, 0.45),
-            "employee_satisfaction": random.uniform(0.80, 0.95)
+            "distractions_identified": len(_DISTRACTION_SOURCES),
+            "distractions_eliminated": self._rng.randint(3, 5),
+            "focus_time_increase": self._rng.uniform(0.35, 0.55),
+            "productivity_boost": self._rng.uniform(0.25, 0.45),
+            "employee_satisfaction": self._rng.uniform(0.80, 0.95)
         }
         
         self.metrics["value_generated"] += elimination_report["distractions_eliminated"] * 25000
         
         return elimination_report
     
-    async def optimize_workspace(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def optimize_workspace(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize digital and physical workspace for productivity"""
         
         workspace_optimization = {
             "workspaces_analyzed": params.get("workspace_count", 100),
-            "recommendations_made": random.randint(300, 500),
-            "implementations": random.randint(200, 400),
-            "productivity_gain": random.uniform(0.20, 0.35),
-            "ergonomic_improvements": random.randint(50, 100),
-            "tool_optimizations": random.randint(30, 60)
+            "recommendations_made": self._rng.randint(300, 500),
+            "implementations": self._rng.randint(200, 400),
+            "productivity_gain": self._rng.uniform(0.20, 0.35),
+            "ergonomic_improvements": self._rng.randint(50, 100),
+            "tool_optimizations": self._rng.randint(30, 60)
         }
         
         self.metrics["value_generated"] += workspace_optimization["implementations"] * 500
         
         return workspace_optimization
     
-    async def manage_cognitive_load(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def manage_cognitive_load(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Manage cognitive load across teams"""
         
         cognitive_management = {
             "employees_analyzed": params.get("employee_count", 100),
-            "overload_cases_detected": random.randint(20, 40),
-            "load_balanced": random.randint(15, 35),
-            "task_redistribution": random.randint(50, 100),
-            "mental_fatigue_reduction": random.uniform(0.30, 0.50),
-            "decision_quality_improvement": random.uniform(0.25, 0.40)
+            "overload_cases_detected": self._rng.randint(20, 40),
+            "load_balanced": self._rng.randint(15, 35),
+            "task_redistribution": self._rng.randint(50, 100),
+            "mental_fatigue_reduction": self._rng.uniform(0.30, 0.50),
+            "decision_quality_improvement": self._rng.uniform(0.25, 0.40)
         }
         
         self.metrics["value_generated"] += cognitive_management["load_balanced"] * 8000
@@ -336,7 +434,7 @@ class ABASProductivityOptimizerAgent(AutonomousAgent):
         return cognitive_management
 
 
-class DASTContextOrchestratorAgent(AutonomousAgent):
+class DASTContextOrchestratorAgent(_ProductAgent):
     """
     DΛST Agent - Autonomous Context Intelligence Orchestrator
     Tracks and predicts all organizational context and knowledge
@@ -345,111 +443,105 @@ class DASTContextOrchestratorAgent(AutonomousAgent):
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, "DΛST_Context_Orchestrator")
+        self.kind = AgentKind.DAST
+        self._rng = random.Random()  # Per-agent generator for simulated telemetry
         self.knowledge_graph = {}
         self.context_patterns = {}
         self.predictions = {}
-        
-    async def execute_single_task(self, task: AgentTask) -> Any:
-        """Execute DΛST-specific tasks"""
-        
-        if task.action == "build_knowledge_graph":
-            return await self.build_knowledge_graph(task.parameters)
-        
-        elif task.action == "predict_information_needs":
-            return await self.predict_information_needs(task.parameters)
-        
-        elif task.action == "optimize_knowledge_flow":
-            return await self.optimize_knowledge_flow(task.parameters)
-        
-        elif task.action == "identify_knowledge_gaps":
-            return await self.identify_knowledge_gaps(task.parameters)
-        
-        elif task.action == "create_context_intelligence":
-            return await self.create_context_intelligence(task.parameters)
-        
-        return await super().execute_single_task(task)
-    
-    async def build_knowledge_graph(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._set_handlers({
+            "build_knowledge_graph": self.build_knowledge_graph,
+            "predict_information_needs": self.predict_information_needs,
+            "optimize_knowledge_flow": self.optimize_knowledge_flow,
+            "identify_knowledge_gaps": self.identify_knowledge_gaps,
+            "create_context_intelligence": self.create_context_intelligence
+        })
+        
+    @_sync_handler
+    def build_knowledge_graph(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Build comprehensive knowledge graph of organization"""
         
         graph_stats = {
-            "nodes_created": random.randint(1000, 5000),
-            "edges_created": random.randint(5000, 20000),
-            "patterns_discovered": random.randint(50, 200),
-            "insights_generated": random.randint(20, 100),
-            "knowledge_domains": random.randint(10, 30),
-            "cross_connections": random.randint(100, 500)
+            "nodes_created": self._rng.randint(1000, 5000),
+            "edges_created": self._rng.randint(5000, 20000),
+            "patterns_discovered": self._rng.randint(50, 200),
+            "insights_generated": self._rng.randint(20, 100),
+            "knowledge_domains": self._rng.randint(10, 30),
+            "cross_connections": self._rng.randint(100, 500)
         }
         
         self.metrics["value_generated"] += graph_stats["insights_generated"] * 5000
         
-        logger.info(f"DΛST Agent created knowledge graph with {graph_stats['nodes_created']} nodes")
+        logger.info("DΛST Agent created knowledge graph with %s nodes", graph_stats["nodes_created"])
         
         return graph_stats
     
-    async def predict_information_needs(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def predict_information_needs(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Predict what information employees will need"""
         
-        predictions_made = random.randint(100, 500)
+        predictions_made = self._rng.randint(100, 500)
         
         prediction_results = {
             "predictions_made": predictions_made,
-            "accuracy_rate": random.uniform(0.75, 0.95),
-            "time_saved_hours": random.randint(50, 200),
-            "decisions_accelerated": random.randint(30, 100),
-            "information_delivered_proactively": random.randint(200, 1000),
-            "search_time_reduction": random.uniform(0.60, 0.80)
+            "accuracy_rate": self._rng.uniform(0.75, 0.95),
+            "time_saved_hours": self._rng.randint(50, 200),
+            "decisions_accelerated": self._rng.randint(30, 100),
+            "information_delivered_proactively": self._rng.randint(200, 1000),
+            "search_time_reduction": self._rng.uniform(0.60, 0.80)
         }
         
         self.metrics["value_generated"] += prediction_results["time_saved_hours"] * 150
         
         return prediction_results
     
-    async def optimize_knowledge_flow(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def optimize_knowledge_flow(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize how knowledge flows through the organization"""
         
         flow_optimization = {
-            "bottlenecks_identified": random.randint(10, 30),
-            "bottlenecks_resolved": random.randint(8, 25),
-            "knowledge_paths_optimized": random.randint(50, 150),
-            "information_latency_reduction": random.uniform(0.40, 0.60),
-            "knowledge_sharing_increase": random.uniform(0.50, 0.80),
-            "collaboration_improvement": random.uniform(0.35, 0.55)
+            "bottlenecks_identified": self._rng.randint(10, 30),
+            "bottlenecks_resolved": self._rng.randint(8, 25),
+            "knowledge_paths_optimized": self._rng.randint(50, 150),
+            "information_latency_reduction": self._rng.uniform(0.40, 0.60),
+            "knowledge_sharing_increase": self._rng.uniform(0.50, 0.80),
+            "collaboration_improvement": self._rng.uniform(0.35, 0.55)
         }
         
         self.metrics["value_generated"] += flow_optimization["bottlenecks_resolved"] * 20000
         
         return flow_optimization
     
-    async def identify_knowledge_gaps(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def identify_knowledge_gaps(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Identify critical knowledge gaps in organization"""
         
         gap_analysis = {
-            "gaps_identified": random.randint(20, 50),
-            "critical_gaps": random.randint(5, 15),
-            "recommendations_made": random.randint(30, 80),
-            "training_needs_identified": random.randint(10, 30),
-            "expertise_gaps": random.randint(5, 15),
-            "documentation_gaps": random.randint(15, 40)
+            "gaps_identified": self._rng.randint(20, 50),
+            "critical_gaps": self._rng.randint(5, 15),
+            "recommendations_made": self._rng.randint(30, 80),
+            "training_needs_identified": self._rng.randint(10, 30),
+            "expertise_gaps": self._rng.randint(5, 15),
+            "documentation_gaps": self._rng.randint(15, 40)
         }
         
         # Autonomous action: Create training programs
-        gap_analysis["training_programs_created"] = random.randint(3, 10)
+        gap_analysis["training_programs_created"] = self._rng.randint(3, 10)
         
         self.metrics["value_generated"] += gap_analysis["critical_gaps"] * 30000
         
         return gap_analysis
     
-    async def create_context_intelligence(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_sync_handler
+    def create_context_intelligence(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create real-time context intelligence for decision making"""
         
         context_intelligence = {
-            "contexts_analyzed": random.randint(100, 300),
-            "decisions_supported": random.randint(50, 150),
-            "context_switches_optimized": random.randint(200, 500),
-            "relevant_info_delivered": random.randint(1000, 3000),
-            "decision_speed_improvement": random.uniform(0.40, 0.60),
-            "decision_quality_improvement": random.uniform(0.30, 0.50)
+            "contexts_analyzed": self._rng.randint(100, 300),
+            "decisions_supported": self._rng.randint(50, 150),
+            "context_switches_optimized": self._rng.randint(200, 500),
+            "relevant_info_delivered": self._rng.randint(1000, 3000),
+            "decision_speed_improvement": self._rng.uniform(0.40, 0.60),
+            "decision_quality_improvement": self._rng.uniform(0.30, 0.50)
         }
         
         self.metrics["value_generated"] += context_intelligence["decisions_supported"] * 10000
@@ -457,14 +549,116 @@ class DASTContextOrchestratorAgent(AutonomousAgent):
         return context_intelligence
 
 
+@dataclass
+class _WorkforceTotals:
+    """Fleet-wide metric totals gathered in one pass"""
+    total_value: float = 0
+    monthly_cost: float = 0
+    uptime_hours: float = 0
+    tasks_completed: int = 0
+    decisions_made: int = 0
+
+
+# Hot aggregate metrics stored column-wise by the orchestrator, with their array typecodes
+_METRIC_COLUMNS = (
+    ("value_generated", "d"),
+    ("uptime_hours", "d"),
+    ("tasks_completed", "q"),
+    ("decisions_made", "q")
+)
+
+
+class _MirroredMetrics(dict):
+    """Agent metrics dict that mirrors writes to hot fields into the orchestrator's columns"""
+    
+    __slots__ = ("_columns", "_index")
+    
+    def __init__(self, metrics: Dict[str, Any], columns: Dict[str, array], index: int):
+        super().__init__(metrics)
+        self._columns = columns
+        self._index = index
+    
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        column = self._columns.get(key)
+        if column is not None:
+            column[self._index] = value
+
+
+@dataclass(frozen=True)
+class _PoolSpec:
+    """How one Lambda product is staffed and what goal each of its agents receives"""
+    agent_cls: type
+    id_prefix: str
+    employees_per_agent: int
+    max_autonomous_days: int
+    goal_description: str
+    success_criteria: Dict[str, Any]
+    goal_priority: AgentPriority
+
+
+_WORKFORCE_POOLS = (
+    # NIΛS agents (1 per 100 employees)
+    _PoolSpec(
+        agent_cls=NIASEmotionalIntelligenceAgent,
+        id_prefix="nias",
+        employees_per_agent=100,
+        max_autonomous_days=7,
+        goal_description="Optimize emotional well-being for 100 employees",
+        success_criteria={
+            "stress_reduction": 0.3,
+            "satisfaction_increase": 0.9,
+            "burnout_prevention": 0.95
+        },
+        goal_priority=AgentPriority.HIGH
+    ),
+    # ΛBAS agents (1 per 200 employees)
+    _PoolSpec(
+        agent_cls=ABASProductivityOptimizerAgent,
+        id_prefix="abas",
+        employees_per_agent=200,
+        max_autonomous_days=7,
+        goal_description="Maximize productivity for 200 employees",
+        success_criteria={
+            "productivity_increase": 0.4,
+            "meeting_reduction": 0.3,
+            "flow_state_hours": 1000
+        },
+        goal_priority=AgentPriority.HIGH
+    ),
+    # DΛST agents (1 per 500 employees)
+    _PoolSpec(
+        agent_cls=DASTContextOrchestratorAgent,
+        id_prefix="dast",
+        employees_per_agent=500,
+        max_autonomous_days=14,
+        goal_description="Optimize knowledge management for 500 employees",
+        success_criteria={
+            "knowledge_graph_coverage": 0.9,
+            "prediction_accuracy": 0.85,
+            "information_latency": 0.2
+        },
+        goal_priority=AgentPriority.NORMAL
+    )
+)
+
+
 class LambdaWorkforceOrchestrator:
     """
     Orchestrates the entire Lambda AI Workforce
     Implements Sam Altman's vision of AI agents materially changing company output
     """
     
-    def __init__(self):
+    def __init__(self, num_workers: int = 8):
         self.agents = {}
+        self._monthly_cost = 0  # Subscription prices are fixed per agent, so the fleet total is kept at registration
+        # Struct-of-arrays copy of the hot metrics, one slot per registered agent (slot = agent._idx)
+        self._metric_columns = {name: array(typecode) for name, typecode in _METRIC_COLUMNS}
+        self._run_tasks: List[asyncio.Task] = []
+        # Bounded pool that executes agent tasks; created inside the running loop on deploy
+        self.num_workers = num_workers
+        self._task_queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
         self.total_value_generated = 0
         self.company_metrics = {
             "productivity_improvement": 0,
@@ -473,102 +667,117 @@ class LambdaWorkforceOrchestrator:
             "revenue_increase": 0
         }
     
+    def _start_workers(self):
+        """Start the task worker pool once"""
+        if self._task_queue is not None:
+            return
+        self._task_queue = asyncio.Queue(maxsize=256)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.num_workers)]
+    
+    async def _worker(self):
+        """Execute queued agent tasks and hand each outcome back to its submitter"""
+        while True:
+            agent, task, future = await self._task_queue.get()
+            try:
+                result = await agent.execute_single_task(task)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._task_queue.task_done()
+    
+    async def _submit_task(self, agent: AutonomousAgent, task: AgentTask) -> Any:
+        """Queue a task for the worker pool (waits while the queue is full) and await its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self._task_queue.put((agent, task, future))
+        return await future
+    
     async def deploy_lambda_workforce(self, company_size: int = 1000):
         """Deploy complete Lambda AI workforce for a company"""
         
-        logger.info(f"Deploying Lambda AI Workforce for {company_size} employee company")
+        self._start_workers()
         
-        # Deploy NIΛS agents (1 per 100 employees)
-        nias_count = max(1, company_size // 100)
-        for i in range(nias_count):
-            agent = NIASEmotionalIntelligenceAgent(f"nias_{i:03d}")
-            await agent.initialize({
-                "max_autonomous_days": 7,
-                "company_size": company_size
-            })
-            self.agents[agent.agent_id] = agent
-            
-            # Set goal
-            goal = AgentGoal(
-                description=f"Optimize emotional well-being for {100} employees",
-                success_criteria={
-                    "stress_reduction": 0.3,
-                    "satisfaction_increase": 0.9,
-                    "burnout_prevention": 0.95
-                },
-                priority=AgentPriority.HIGH
-            )
-            await agent.set_goal(goal)
-            
-            # Start autonomous operation
-            asyncio.create_task(agent.run())
-        
-        # Deploy ΛBAS agents (1 per 200 employees)
-        abas_count = max(1, company_size // 200)
-        for i in range(abas_count):
-            agent = ABASProductivityOptimizerAgent(f"abas_{i:03d}")
-            await agent.initialize({
-                "max_autonomous_days": 7,
-                "company_size": company_size
-            })
-            self.agents[agent.agent_id] = agent
-            
-            # Set goal
-            goal = AgentGoal(
-                description=f"Maximize productivity for {200} employees",
-                success_criteria={
-                    "productivity_increase": 0.4,
-                    "meeting_reduction": 0.3,
-                    "flow_state_hours": 1000
-                },
-                priority=AgentPriority.HIGH
-            )
-            await agent.set_goal(goal)
-            
-            asyncio.create_task(agent.run())
-        
-        # Deploy DΛST agents (1 per 500 employees)
-        dast_count = max(1, company_size // 500)
-        for i in range(dast_count):
-            agent = DASTContextOrchestratorAgent(f"dast_{i:03d}")
-            await agent.initialize({
-                "max_autonomous_days": 14,
+        logger.info("Deploying Lambda AI Workforce for %s employee company", company_size)
+        
+        # (agent, config, goal) for every agent, pool by pool in deployment order
+        deployments = []
+        for pool in _WORKFORCE_POOLS:
+            config = {
+                "max_autonomous_days": pool.max_autonomous_days,
                 "company_size": company_size
-            })
-            self.agents[agent.agent_id] = agent
-            
-            # Set goal
-            goal = AgentGoal(
-                description=f"Optimize knowledge management for {500} employees",
-                success_criteria={
-                    "knowledge_graph_coverage": 0.9,
-                    "prediction_accuracy": 0.85,
-                    "information_latency": 0.2
-                },
-                priority=AgentPriority.NORMAL
+            }
+            agent_count = max(1, company_size // pool.employees_per_agent)
+            agents = [pool.agent_cls(f"{pool.id_prefix}_{i:03d}") for i in range(agent_count)]
+            deployments.extend(
+                (agent, config, AgentGoal(
+                    description=pool.goal_description,
+                    success_criteria=dict(pool.success_criteria),
+                    priority=pool.goal_priority
+                ))
+                for agent in agents
             )
-            await agent.set_goal(goal)
-            
-            asyncio.create_task(agent.run())
         
-        logger.info(f"Deployed {len(self.agents)} Lambda agents for workforce automation")
-    
-    def calculate_roi(self) -> Dict[str, Any]:
-        """Calculate ROI of Lambda AI Workforce"""
+        # Every pool's agents are initialized in one batch, then goals are set in a second
+        await asyncio.gather(*(agent.initialize(config) for agent, config, _ in deployments))
+        for agent, _, _ in deployments:
+            self._register_agent(agent)
         
-        total_value = sum(agent.metrics["value_generated"] for agent in self.agents.values())
+        await asyncio.gather(*(agent.set_goal(goal) for agent, _, goal in deployments))
         
-        # Cost of agents (subscription model)
-        agent_costs = {
-            "NIΛS": 5000,  # $5K/month per agent
-            "ΛBAS": 8000,  # $8K/month per agent
-            "DΛST": 6000   # $6K/month per agent
-        }
+        # Route task execution through the bounded worker pool
+        for agent, _, _ in deployments:
+            agent.task_executor = functools.partial(self._submit_task, agent)
+        
+        # Start autonomous operation; hold the tasks so the event loop's weak references are not the only ones
+        self._run_tasks.extend(asyncio.create_task(agent.run()) for agent, _, _ in deployments)
         
-        monthly_cost = sum(
-            agent_costs.get(agent.agent_type.split("_")[0], 5000)
-            for agent in self.agents.values()
+        logger.info("Deployed %s Lambda agents for workforce automation", len(self.agents))
+    
+    async def shutdown(self, persist_state: bool = False):
+        """Stop all agents, drain the task queue and cancel the worker pool (agent state is saved only on request)"""
+        await asyncio.gather(*(agent.shutdown(persist_state) for agent in self.agents.values()))
+        await asyncio.gather(*self._run_tasks, return_exceptions=True)
+        self._run_tasks.clear()
+        
+        if self._task_queue is not None:
+            await self._task_queue.join()
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers.clear()
+            self._task_queue = None
+    
+    def _register_agent(self, agent: AutonomousAgent):
+        """Add an agent to the workforce and give it a slot in the metric columns"""
+        columns = self._metric_columns
+        agent._idx = len(columns["value_generated"])
+        for name, column in columns.items():
+            column.append(agent.metrics[name])
+        agent.metrics = _MirroredMetrics(agent.metrics, columns, agent._idx)
+        
+        self.agents[agent.agent_id] = agent
+        self._monthly_cost += _MONTHLY_COST_BY_KIND.get(getattr(agent, "kind", None), _DEFAULT_MONTHLY_COST)
+    
+    def _aggregate_metrics(self) -> _WorkforceTotals:
+        """Sum each contiguous metric column"""
+        columns = self._metric_columns
+        return _WorkforceTotals(
+            total_value=sum(columns["value_generated"]),
+            monthly_cost=self._monthly_cost,
+            uptime_hours=sum(columns["uptime_hours"]),
+            tasks_completed=sum(columns["tasks_completed"]),
+            decisions_made=sum(columns["decisions_made"])
         )
+    
+    def calculate_roi(self) -> Dict[str, Any]:
+        """Calculate ROI of Lambda AI Workforce"""
+        
+        totals = self._aggregate_metrics()
+        total_value = totals.total_value
+        monthly_cost = totals.monthly_cost
         
         roi = {
             "total_value_generated": total_value,
@@ -577,9 +786,9 @@ class LambdaWorkforceOrchestrator:
             "roi_percentage": ((total_value - monthly_cost) / monthly_cost * 100) if monthly_cost > 0 else 0,
             "payback_period_days": (monthly_cost / (total_value / 30)) if total_value > 0 else float('inf'),
             "agents_deployed": len(self.agents),
-            "autonomous_hours": sum(agent.metrics["uptime_hours"] for agent in self.agents.values()),
-            "tasks_completed": sum(agent.metrics["tasks_completed"] for agent in self.agents.values()),
-            "decisions_made": sum(agent.metrics["decisions_made"] for agent in self.agents.values())
+            "autonomous_hours": totals.uptime_hours,
+            "tasks_completed": totals.tasks_completed,
+            "decisions_made": totals.decisions_made
         }
         
         return roi
@@ -587,39 +796,35 @@ class LambdaWorkforceOrchestrator:
     async def generate_executive_report(self) -> Dict[str, Any]:
         """Generate executive report on AI workforce performance"""
         
+        roi = self.calculate_roi()
+        
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "executive_summary": {
                 "agents_active": len(self.agents),
-                "total_value_generated": sum(agent.metrics["value_generated"] for agent in self.agents.values()),
-                "roi": self.calculate_roi()["roi_percentage"],
-                "recommendation": "SCALE UP" if self.calculate_roi()["roi_percentage"] > 200 else "MAINTAIN"
+                "total_value_generated": roi["total_value_generated"],
+                "roi": roi["roi_percentage"],
+                "recommendation": "SCALE UP" if roi["roi_percentage"] > 200 else "MAINTAIN"
             },
-            "agent_performance": {},
+            # Individual agent performance; get_status is synchronous, so a comprehension suffices
+            "agent_performance": {agent_id: agent.get_status() for agent_id, agent in self.agents.items()},
             "business_impact": {
                 "productivity_gain": random.uniform(0.25, 0.45),
                 "cost_reduction": random.uniform(0.20, 0.35),
                 "employee_satisfaction": random.uniform(0.15, 0.30),
                 "innovation_increase": random.uniform(0.30, 0.50)
             },
-            "future_recommendations": [
-                "Deploy additional ΛBAS agents for Q2 planning",
-                "Integrate with GPT-5 for enhanced decision making",
-                "Expand to customer service with NIΛS agents",
-                "Implement predictive hiring with DΛST"
-            ]
+            "future_recommendations": _FUTURE_RECOMMENDATIONS
         }
         
-        # Add individual agent performance
-        for agent_id, agent in self.agents.items():
-            report["agent_performance"][agent_id] = agent.get_status()
-        
         return report
 
 
 # Example usage
 if __name__ == "__main__":
     async def main():
+        _install_eager_task_factory()
+
         # Create workforce orchestrator
         orchestrator = LambdaWorkforceOrchestrator()
         
@@ -640,5 +845,13 @@ if __name__ == "__main__":
         print(f"Monthly Cost: ${roi['monthly_cost']:,.2f}")
         print(f"ROI: {roi['roi_percentage']:.1f}%")
         print(f"Payback Period: {roi['payback_period_days']:.1f} days")
+        
+        await orchestrator.shutdown()
     
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
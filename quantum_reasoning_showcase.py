@@ -23,35 +23,113 @@ License: LUKHAS Commercial License
 import json
 import time
 import random
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from functools import lru_cache
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Any, Optional
 import sys
 import os
 
+try:
+    import orjson  # Optional: faster results serialization
+except ImportError:
+    orjson = None
+
+# Fixed capabilities section of every showcase summary, rendered once at import
+_CAPABILITIES = (
+    "Consciousness-aware adaptation",
+    "Cultural sensitivity and respect",
+    "Quantum security protocols",
+    "Emergency override systems",
+    "Dream-state visualization",
+    "Real-time pattern generation",
+    "Constitutional AI compliance",
+    "Multi-user profile support"
+)
+_CAPABILITIES_BLOCK = "\n".join(f"   ✅ {capability}" for capability in _CAPABILITIES)
+
+# Slotted dataclasses drop the per-instance __dict__ (dataclass slots= needs Python 3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class DemoUser:
+    """A showcase user profile"""
+    name: str
+    user_id: str
+    description: str
+    consciousness_level: float
+    cultural_profile: Dict[str, Any]
+    security_clearance: str
+    attention_focus: List[str]
+    personality: str
+
+
+# Adaptation-analysis message templates, indexed by tier (lowest first)
+_CONSCIOUSNESS_MESSAGES = (
+    "Relaxed state ({:.2f}) → Simplified, calming patterns",
+    "Balanced state ({:.2f}) → Standard adaptive features",
+    "High consciousness ({:.2f}) → Advanced QRG features activated"
+)
+_RESONANCE_TIERS = (0.7, 0.9)  # Upper bounds (inclusive) of the basic and good tiers
+_RESONANCE_MESSAGES = (
+    "Basic consciousness compatibility ({:.2f})",
+    "Good consciousness alignment ({:.2f})",
+    "Excellent consciousness resonance ({:.2f})"
+)
+_QUANTUM_CLEARANCES = frozenset({'secret', 'cosmic'})
+
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from qrg_integration import LukhusQRGIntegrator, QRGType, SecurityLevel
 
+def _load_qrg_integration():
+    """Import the QRG integration layer on first use; it drags in the whole consciousness/cultural/quantum stack"""
+    global LukhusQRGIntegrator, QRGType, SecurityLevel
+    from qrg_integration import LukhusQRGIntegrator, QRGType, SecurityLevel
+
+
+def _dump_results_bytes(data: Dict[str, Any], indent: bool = True) -> bytes:
+    """Serialize showcase results as JSON (indented, or one line for JSONL), preferring orjson when installed"""
+    if orjson is not None:
+        # Datetimes and dataclasses go through default=str, as they do with the json module
+        options = (orjson.OPT_NON_STR_KEYS
+                   | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=options)
+    return json.dumps(data, indent=2 if indent else None, default=str).encode()
+
+
+def _qr_cell_grid(count: int, density: float, draw) -> List[str]:
+    """Row-major cells for the QR preview grid: a filled module wherever a draw falls under density"""
+    # random() is in [0, 1), so these densities fix every cell without drawing at all
+    if density >= 1:
+        return ["██"] * count
+    if density <= 0:
+        return ["  "] * count
+    return ["██" if draw() < density else "  " for _ in range(count)]
+
+
+@lru_cache(maxsize=128)
 def create_ascii_qr_pattern(size: int = 25, density: float = 0.5, style: str = "standard") -> str:
-    """Create a simple ASCII QR pattern for visualization"""
-    import random
-    random.seed(int(density * 1000))
+    """Create a simple ASCII QR pattern for visualization (memoized: the pattern is fully determined by the arguments)"""
+    # Private generator seeded from the density: same sequence as reseeding the global one, without touching it
+    rng = random.Random(int(density * 1000))
 
-    pattern = "┌" + "─" * (size + 2) + "┐\n"
+    border = "─" * (size + 2)
 
-    for i in range(size // 2):  # Reduced height for readability
-        row = "│"
-        for j in range(size):
-            if random.random() < density:
-                row += "██"
-            else:
-                row += "  "
-        row += "│\n"
-        pattern += row
+    # Threshold the whole grid in one pass (same draw order as per-cell sampling), then slice it into rows
+    height = size // 2  # Reduced height for readability
+    cells = _qr_cell_grid(height * size, density, rng.random)
 
-    pattern += "└" + "─" * (size + 2) + "┘"
-    return pattern
+    # Collect every piece and join once instead of growing the pattern string row by row
+    parts = ["┌", border, "┐\n"]
+    for start in range(0, height * size, size or 1):
+        parts += ("│", "".join(cells[start:start + size]), "│\n")
+    parts += ("└", border, "┘")
+    return "".join(parts)
 
 
 class QRGShowcase:
@@ -64,11 +142,17 @@ class QRGShowcase:
 
     def __init__(self):
         """Initialize the showcase system"""
+        _load_qrg_integration()
         self.integrator = LukhusQRGIntegrator()
         self.demo_users = self._create_demo_user_profiles()
+        self._type_user = self._select_type_users()
+        # Readability pauses only make sense when someone is watching a terminal
+        self._interactive = sys.stdout.isatty()
+        # Bit per QRG type, so the demonstrated types are tracked as an int bitmask
+        self._type_bits = {qrg_type: 1 << i for i, qrg_type in enumerate(QRGType)}
         self.showcase_stats = {
             "total_demonstrations": 0,
-            "types_demonstrated": set(),
+            "types_demonstrated": 0,
             "user_profiles_tested": 0,
             "performance_metrics": [],
             "start_time": datetime.now()
@@ -81,125 +165,142 @@ class QRGShowcase:
         print(f"🚨 Emergency protocols: Active")
         print(f"💭 Dream state engine: Active")
 
-    def _create_demo_user_profiles(self) -> List[Dict[str, Any]]:
+    def _create_demo_user_profiles(self) -> List[DemoUser]:
         """Create diverse demo user profiles"""
         return [
-            {
-                "name": "Dr. Sarah Chen",
-                "user_id": "dr_chen_001",
-                "description": "Neuroscientist studying consciousness",
-                "consciousness_level": 0.85,
-                "cultural_profile": {"region": "east_asian", "preferences": {"respect": "formal", "colors": ["blue", "silver"]}},
-                "security_clearance": "secret",
-                "attention_focus": ["research", "consciousness", "meditation"],
-                "personality": "analytical, contemplative, precise"
-            },
-            {
-                "name": "Ahmed Al-Rashid",
-                "user_id": "ahmed_002",
-                "description": "Quantum cryptographer and security expert",
-                "consciousness_level": 0.75,
-                "cultural_profile": {"region": "islamic", "preferences": {"symbols": ["geometric"], "respect": "respectful"}},
-                "security_clearance": "cosmic",
-                "attention_focus": ["security", "cryptography", "protection"],
-                "personality": "methodical, protective, innovative"
-            },
-            {
-                "name": "Maya Thunderheart",
-                "user_id": "maya_003",
-                "description": "Indigenous wisdom keeper and digital rights activist",
-                "consciousness_level": 0.90,
-                "cultural_profile": {"region": "indigenous", "preferences": {"symbols": ["nature", "cycles"], "respect": "ceremonial"}},
-                "security_clearance": "protected",
-                "attention_focus": ["wisdom", "nature", "community", "protection"],
-                "personality": "intuitive, connected, wise"
-            },
-            {
-                "name": "Alex Dreamweaver",
-                "user_id": "alex_004",
-                "description": "Lucid dreaming researcher and consciousness explorer",
-                "consciousness_level": 0.65,
-                "cultural_profile": {"region": "universal", "preferences": {"symbols": ["flowing", "ethereal"]}},
-                "security_clearance": "protected",
-                "attention_focus": ["dreams", "exploration", "consciousness"],
-                "personality": "creative, fluid, exploratory"
-            },
-            {
-                "name": "Commander Riley",
-                "user_id": "cmd_riley_005",
-                "description": "Emergency response coordinator",
-                "consciousness_level": 0.80,
-                "cultural_profile": {"region": "universal", "preferences": {"efficiency": "high", "clarity": "maximum"}},
-                "security_clearance": "secret",
-                "attention_focus": ["emergency", "coordination", "rapid_response"],
-                "personality": "decisive, clear, protective"
-            },
-            {
-                "name": "Zara Al-Quantum",
-                "user_id": "zara_006",
-                "description": "Quantum consciousness researcher",
-                "consciousness_level": 0.95,
-                "cultural_profile": {"region": "universal", "preferences": {"innovation": "cutting_edge"}},
-                "security_clearance": "cosmic",
-                "attention_focus": ["quantum", "consciousness", "transcendence", "innovation"],
-                "personality": "transcendent, innovative, boundary-pushing"
-            }
+            DemoUser(
+                name="Dr. Sarah Chen",
+                user_id="dr_chen_001",
+                description="Neuroscientist studying consciousness",
+                consciousness_level=0.85,
+                cultural_profile={"region": "east_asian", "preferences": {"respect": "formal", "colors": ["blue", "silver"]}},
+                security_clearance="secret",
+                attention_focus=["research", "consciousness", "meditation"],
+                personality="analytical, contemplative, precise"
+            ),
+            DemoUser(
+                name="Ahmed Al-Rashid",
+                user_id="ahmed_002",
+                description="Quantum cryptographer and security expert",
+                consciousness_level=0.75,
+                cultural_profile={"region": "islamic", "preferences": {"symbols": ["geometric"], "respect": "respectful"}},
+                security_clearance="cosmic",
+                attention_focus=["security", "cryptography", "protection"],
+                personality="methodical, protective, innovative"
+            ),
+            DemoUser(
+                name="Maya Thunderheart",
+                user_id="maya_003",
+                description="Indigenous wisdom keeper and digital rights activist",
+                consciousness_level=0.90,
+                cultural_profile={"region": "indigenous", "preferences": {"symbols": ["nature", "cycles"], "respect": "ceremonial"}},
+                security_clearance="protected",
+                attention_focus=["wisdom", "nature", "community", "protection"],
+                personality="intuitive, connected, wise"
+            ),
+            DemoUser(
+                name="Alex Dreamweaver",
+                user_id="alex_004",
+                description="Lucid dreaming researcher and consciousness explorer",
+                consciousness_level=0.65,
+                cultural_profile={"region": "universal", "preferences": {"symbols": ["flowing", "ethereal"]}},
+                security_clearance="protected",
+                attention_focus=["dreams", "exploration", "consciousness"],
+                personality="creative, fluid, exploratory"
+            ),
+            DemoUser(
+                name="Commander Riley",
+                user_id="cmd_riley_005",
+                description="Emergency response coordinator",
+                consciousness_level=0.80,
+                cultural_profile={"region": "universal", "preferences": {"efficiency": "high", "clarity": "maximum"}},
+                security_clearance="secret",
+                attention_focus=["emergency", "coordination", "rapid_response"],
+                personality="decisive, clear, protective"
+            ),
+            DemoUser(
+                name="Zara Al-Quantum",
+                user_id="zara_006",
+                description="Quantum consciousness researcher",
+                consciousness_level=0.95,
+                cultural_profile={"region": "universal", "preferences": {"innovation": "cutting_edge"}},
+                security_clearance="cosmic",
+                attention_focus=["quantum", "consciousness", "transcendence", "innovation"],
+                personality="transcendent, innovative, boundary-pushing"
+            )
         ]
 
-    def demonstrate_user_profile(self, user_profile: Dict[str, Any]) -> Dict[str, Any]:
+    def _select_type_users(self) -> Dict[Any, DemoUser]:
+        """Representative demo user for each focused QRG type, resolved once"""
+        users = self.demo_users
+        return {
+            QRGType.CONSCIOUSNESS_ADAPTIVE: next(u for u in users if u.consciousness_level > 0.8),
+            QRGType.CULTURAL_SYMBOLIC: next(u for u in users if u.cultural_profile['region'] != 'universal'),
+            QRGType.QUANTUM_ENCRYPTED: next(u for u in users if u.security_clearance == 'cosmic'),
+            QRGType.DREAM_STATE: next(u for u in users if 'dreams' in u.attention_focus),
+            QRGType.EMERGENCY_OVERRIDE: next(u for u in users if 'emergency' in u.attention_focus)
+        }
+
+    def demonstrate_user_profile(self, user_profile: DemoUser) -> Dict[str, Any]:
         """Demonstrate QRG generation for a specific user profile"""
-        print(f"\n👤 Demonstrating QRG for: {user_profile['name']}")
-        print(f"   📝 {user_profile['description']}")
-        print(f"   🧠 Consciousness level: {user_profile['consciousness_level']}")
-        print(f"   🌍 Cultural context: {user_profile['cultural_profile']['region']}")
-        print(f"   🔐 Security clearance: {user_profile['security_clearance']}")
-        print(f"   💭 Personality: {user_profile['personality']}")
+        # Each section is collected and written in one call instead of a print per line
+        out = [
+            f"\n👤 Demonstrating QRG for: {user_profile.name}",
+            f"   📝 {user_profile.description}",
+            f"   🧠 Consciousness level: {user_profile.consciousness_level}",
+            f"   🌍 Cultural context: {user_profile.cultural_profile['region']}",
+            f"   🔐 Security clearance: {user_profile.security_clearance}",
+            f"   💭 Personality: {user_profile.personality}"
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
 
         # Create context for this user
         context = self.integrator.create_qrg_context(
-            user_id=user_profile['user_id'],
-            security_level=user_profile['security_clearance'],
-            attention_focus=user_profile['attention_focus']
+            user_id=user_profile.user_id,
+            security_level=user_profile.security_clearance,
+            attention_focus=user_profile.attention_focus
         )
 
         # Update context with user-specific data
-        context.consciousness_level = user_profile['consciousness_level']
-        context.cultural_profile = user_profile['cultural_profile']
+        context.consciousness_level = user_profile.consciousness_level
+        context.cultural_profile = user_profile.cultural_profile
 
         # Generate adaptive QRG
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = self.integrator.generate_adaptive_qrg(context)
-        generation_time = time.time() - start_time
+        generation_time = (time.perf_counter_ns() - start_ns) * 1e-9
 
         # Create ASCII visualization
         ascii_pattern = self._create_user_specific_ascii_pattern(user_profile, result)
 
         # Display results
-        print(f"   ✅ Generated {result.qr_type.value.replace('_', ' ').title()} QRG")
-        print(f"   ⚡ Generation time: {generation_time:.3f}s")
-        print(f"   📊 Compliance score: {result.compliance_score:.2f}")
-        print(f"   🌍 Cultural safety: {result.cultural_safety_score:.2f}")
-        print(f"   🧠 Consciousness resonance: {result.consciousness_resonance:.2f}")
-        print(f"   🔐 Security signature: {result.security_signature[:20]}...")
-        print(f"   ⏰ Valid until: {result.expiration.strftime('%H:%M:%S')}")
+        out = []
+        out.append(f"   ✅ Generated {result.qr_type.value.replace('_', ' ').title()} QRG")
+        out.append(f"   ⚡ Generation time: {generation_time:.3f}s")
+        out.append(f"   📊 Compliance score: {result.compliance_score:.2f}")
+        out.append(f"   🌍 Cultural safety: {result.cultural_safety_score:.2f}")
+        out.append(f"   🧠 Consciousness resonance: {result.consciousness_resonance:.2f}")
+        out.append(f"   🔐 Security signature: {result.security_signature[:20]}...")
+        out.append(f"   ⏰ Valid until: {result.expiration.strftime('%H:%M:%S')}")
 
         # Show ASCII pattern
-        print(f"   🎨 QRG Pattern Preview:")
-        print(ascii_pattern)
+        out.append(f"   🎨 QRG Pattern Preview:")
+        out.append(ascii_pattern)
 
         # Analyze adaptation
         adaptation_analysis = self._analyze_qrg_adaptation(user_profile, result)
-        print(f"   🔍 Adaptation Analysis:")
+        out.append(f"   🔍 Adaptation Analysis:")
         for key, value in adaptation_analysis.items():
-            print(f"      • {key}: {value}")
+            out.append(f"      • {key}: {value}")
+        sys.stdout.write("\n".join(out) + "\n")
 
         # Update stats
         self.showcase_stats["total_demonstrations"] += 1
-        self.showcase_stats["types_demonstrated"].add(result.qr_type.value)
+        self.showcase_stats["types_demonstrated"] |= self._type_bits[result.qr_type]
         self.showcase_stats["performance_metrics"].append(generation_time)
 
         demo_result = {
-            "user_profile": user_profile,
+            "user_profile": asdict(user_profile),
             "qrg_result": {
                 "type": result.qr_type.value,
                 "generation_time": generation_time,
@@ -215,16 +316,16 @@ class QRGShowcase:
 
         return demo_result
 
-    def _create_user_specific_ascii_pattern(self, user_profile: Dict[str, Any],
+    def _create_user_specific_ascii_pattern(self, user_profile: DemoUser,
                                           result: Any) -> str:
         """Create user-specific ASCII QR pattern"""
         # Determine pattern characteristics based on user and QRG type
         if result.qr_type == QRGType.CONSCIOUSNESS_ADAPTIVE:
-            complexity = int(20 + (user_profile['consciousness_level'] * 20))
+            complexity = int(20 + (user_profile.consciousness_level * 20))
             pattern_style = "consciousness"
         elif result.qr_type == QRGType.CULTURAL_SYMBOLIC:
             complexity = 25
-            pattern_style = user_profile['cultural_profile']['region']
+            pattern_style = user_profile.cultural_profile['region']
         elif result.qr_type == QRGType.QUANTUM_ENCRYPTED:
             complexity = 35
             pattern_style = "quantum"
@@ -241,35 +342,31 @@ class QRGShowcase:
         # Generate pattern
         pattern = create_ascii_qr_pattern(
             size=complexity,
-            density=user_profile['consciousness_level'],
+            density=user_profile.consciousness_level,
             style=pattern_style
         )
 
         return pattern
 
-    def _analyze_qrg_adaptation(self, user_profile: Dict[str, Any],
+    def _analyze_qrg_adaptation(self, user_profile: DemoUser,
                               result: Any) -> Dict[str, str]:
         """Analyze how the QRG adapted to the user"""
         analysis = {}
 
-        # Consciousness adaptation
-        if user_profile['consciousness_level'] > 0.8:
-            analysis["Consciousness"] = f"High consciousness ({user_profile['consciousness_level']:.2f}) → Advanced QRG features activated"
-        elif user_profile['consciousness_level'] < 0.4:
-            analysis["Consciousness"] = f"Relaxed state ({user_profile['consciousness_level']:.2f}) → Simplified, calming patterns"
-        else:
-            analysis["Consciousness"] = f"Balanced state ({user_profile['consciousness_level']:.2f}) → Standard adaptive features"
+        # Consciousness adaptation: below 0.4 relaxed, above 0.8 high (both bounds belong to balanced)
+        level = user_profile.consciousness_level
+        analysis["Consciousness"] = _CONSCIOUSNESS_MESSAGES[(level >= 0.4) + (level > 0.8)].format(level)
 
         # Cultural adaptation
-        cultural_region = user_profile['cultural_profile']['region']
+        cultural_region = user_profile.cultural_profile['region']
         if cultural_region != 'universal':
             analysis["Cultural"] = f"{cultural_region.title()} context → Culturally respectful pattern generation"
         else:
             analysis["Cultural"] = "Universal design → Inclusive, accessible patterns"
 
         # Security adaptation
-        security_level = user_profile['security_clearance']
-        if security_level in ['secret', 'cosmic']:
+        security_level = user_profile.security_clearance
+        if security_level in _QUANTUM_CLEARANCES:
             analysis["Security"] = f"{security_level.title()} clearance → Quantum-enhanced encryption"
         else:
             analysis["Security"] = f"{security_level.title()} level → Standard security protocols"
@@ -279,17 +376,15 @@ class QRGShowcase:
         analysis["QRG Type"] = f"{qrg_type} selected based on user context and needs"
 
         # Performance adaptation
-        if result.consciousness_resonance > 0.9:
-            analysis["Resonance"] = f"Excellent consciousness resonance ({result.consciousness_resonance:.2f})"
-        elif result.consciousness_resonance > 0.7:
-            analysis["Resonance"] = f"Good consciousness alignment ({result.consciousness_resonance:.2f})"
-        else:
-            analysis["Resonance"] = f"Basic consciousness compatibility ({result.consciousness_resonance:.2f})"
+        resonance = result.consciousness_resonance
+        analysis["Resonance"] = _RESONANCE_MESSAGES[bisect_left(_RESONANCE_TIERS, resonance)].format(resonance)
 
         return analysis
 
-    def run_comprehensive_showcase(self) -> Dict[str, Any]:
-        """Run comprehensive showcase of all user profiles"""
+    def run_comprehensive_showcase(self, interactive: Optional[bool] = None) -> Dict[str, Any]:
+        """Run comprehensive showcase of all user profiles (interactive=None: pause only on a TTY)"""
+        if interactive is None:
+            interactive = self._interactive
         print("🎪 LUKHAS QRG Comprehensive Showcase")
         print("=" * 60)
         print(f"🧪 Testing {len(self.demo_users)} diverse user profiles")
@@ -298,55 +393,54 @@ class QRGShowcase:
 
         showcase_results = []
 
-        for user_profile in self.demo_users:
-            try:
-                demo_result = self.demonstrate_user_profile(user_profile)
-                showcase_results.append(demo_result)
-                self.showcase_stats["user_profiles_tested"] += 1
+        # Full per-user records (with their ASCII patterns) are streamed to JSONL as they
+        # complete; only the slimmed records needed for the summary stay in memory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_file = f"lukhus_qrg_showcase_{timestamp}.jsonl"
 
-                # Small delay for readability
-                time.sleep(0.5)
+        with open(results_file, 'wb') as f:
+            for user_profile in self.demo_users:
+                try:
+                    demo_result = self.demonstrate_user_profile(user_profile)
+                    f.write(_dump_results_bytes(demo_result, indent=False) + b"\n")
+                    showcase_results.append({k: v for k, v in demo_result.items() if k != "ascii_pattern"})
+                    self.showcase_stats["user_profiles_tested"] += 1
 
-            except Exception as e:
-                print(f"   ❌ Error demonstrating {user_profile['name']}: {e}")
+                    # Small delay for readability
+                    if interactive:
+                        time.sleep(0.5)
 
-        return self._generate_showcase_summary(showcase_results)
+                except Exception as e:
+                    print(f"   ❌ Error demonstrating {user_profile.name}: {e}")
 
-    def run_specific_qrg_type_demo(self, qrg_type: QRGType) -> Dict[str, Any]:
+        summary = self._generate_showcase_summary(showcase_results)
+        summary["results_file"] = results_file
+        return summary
+
+    def run_specific_qrg_type_demo(self, qrg_type: "QRGType") -> Dict[str, Any]:
         """Run demo focusing on a specific QRG type"""
         print(f"\n🎯 Focused Demo: {qrg_type.value.replace('_', ' ').title()} QRG")
         print("-" * 50)
 
-        # Select appropriate user for this QRG type
-        if qrg_type == QRGType.CONSCIOUSNESS_ADAPTIVE:
-            user = next(u for u in self.demo_users if u['consciousness_level'] > 0.8)
-        elif qrg_type == QRGType.CULTURAL_SYMBOLIC:
-            user = next(u for u in self.demo_users if u['cultural_profile']['region'] != 'universal')
-        elif qrg_type == QRGType.QUANTUM_ENCRYPTED:
-            user = next(u for u in self.demo_users if u['security_clearance'] == 'cosmic')
-        elif qrg_type == QRGType.DREAM_STATE:
-            user = next(u for u in self.demo_users if 'dreams' in u['attention_focus'])
-        elif qrg_type == QRGType.EMERGENCY_OVERRIDE:
-            user = next(u for u in self.demo_users if 'emergency' in u['attention_focus'])
-        else:
-            user = self.demo_users[0]  # Default
+        # Select appropriate user for this QRG type (first profile by default)
+        user = self._type_user.get(qrg_type, self.demo_users[0])
 
         # Create context and force specific QRG type
         context = self.integrator.create_qrg_context(
-            user_id=user['user_id'],
-            security_level=user['security_clearance'],
-            attention_focus=user['attention_focus']
+            user_id=user.user_id,
+            security_level=user.security_clearance,
+            attention_focus=user.attention_focus
         )
-        context.consciousness_level = user['consciousness_level']
-        context.cultural_profile = user['cultural_profile']
+        context.consciousness_level = user.consciousness_level
+        context.cultural_profile = user.cultural_profile
 
         # Generate specific QRG type
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = self.integrator.generate_adaptive_qrg(context, qrg_type)
-        generation_time = time.time() - start_time
+        generation_time = (time.perf_counter_ns() - start_ns) * 1e-9
 
         # Detailed analysis
-        print(f"👤 Selected user: {user['name']} ({user['description']})")
+        print(f"👤 Selected user: {user.name} ({user.description})")
         print(f"⚡ Generation time: {generation_time:.3f}s")
         print(f"🔗 QRG Type: {result.qr_type.value}")
         print(f"📊 Scores: Compliance={result.compliance_score:.2f}, Cultural={result.cultural_safety_score:.2f}, Consciousness={result.consciousness_resonance:.2f}")
@@ -363,7 +457,7 @@ class QRGShowcase:
 
         return {
             "qrg_type": qrg_type.value,
-            "user": user,
+            "user": asdict(user),
             "result": result,
             "generation_time": generation_time
         }
@@ -383,101 +477,108 @@ class QRGShowcase:
 
         benchmark_results = {}
 
+        # One context per iteration slot, built once and shared by every QRG type
+        contexts = [
+            self.integrator.create_qrg_context(
+                user_id=f"benchmark_user_{i}",
+                security_level="protected"
+            )
+            for i in range(10)  # 10 iterations per type
+        ]
+
+        # Types run one after another so each timing is an uncontended per-call latency
         for qrg_type in qrg_types:
             print(f"🔗 Benchmarking {qrg_type.value}...")
+            stats = self._benchmark_qrg_type(qrg_type, contexts)
+            benchmark_results[qrg_type.value] = stats
+            print(f"   ⚡ Avg: {stats['average_time']:.3f}s, Min: {stats['min_time']:.3f}s, Max: {stats['max_time']:.3f}s")
 
-            times = []
-            for i in range(10):  # 10 iterations per type
-                context = self.integrator.create_qrg_context(
-                    user_id=f"benchmark_user_{i}",
-                    security_level="protected"
-                )
-
-                start_time = time.time()
-                result = self.integrator.generate_adaptive_qrg(context, qrg_type)
-                end_time = time.time()
-
-                times.append(end_time - start_time)
-
-            avg_time = sum(times) / len(times)
-            min_time = min(times)
-            max_time = max(times)
-
-            benchmark_results[qrg_type.value] = {
-                "average_time": avg_time,
-                "min_time": min_time,
-                "max_time": max_time,
-                "iterations": len(times)
-            }
+        return benchmark_results
 
-            print(f"   ⚡ Avg: {avg_time:.3f}s, Min: {min_time:.3f}s, Max: {max_time:.3f}s")
+    def _benchmark_qrg_type(self, qrg_type: "QRGType", contexts: List[Any]) -> Dict[str, Any]:
+        """Time generate_adaptive_qrg for one QRG type over the benchmark contexts"""
+        # Running total / min / max as each iteration finishes, instead of three passes afterwards
+        total_time = 0.0
+        min_time = max_time = None
+        for context in contexts:
+            start_ns = time.perf_counter_ns()
+            self.integrator.generate_adaptive_qrg(context, qrg_type)
+            elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
+
+            total_time += elapsed
+            if min_time is None or elapsed < min_time:
+                min_time = elapsed
+            if max_time is None or elapsed > max_time:
+                max_time = elapsed
 
-        return benchmark_results
+        return {
+            "average_time": total_time / len(contexts),
+            "min_time": min_time,
+            "max_time": max_time,
+            "iterations": len(contexts)
+        }
 
     def _generate_showcase_summary(self, showcase_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate comprehensive showcase summary"""
-        print(f"\n📊 LUKHAS QRG Showcase Summary")
-        print("=" * 50)
+        out = [f"\n📊 LUKHAS QRG Showcase Summary", "=" * 50]
 
         # Calculate statistics
         total_time = sum(self.showcase_stats["performance_metrics"])
         avg_time = total_time / len(self.showcase_stats["performance_metrics"]) if self.showcase_stats["performance_metrics"] else 0
 
-        # QRG type distribution
+        # QRG type distribution, score totals and best performers in a single pass
         type_counts = {}
+        compliance_total = cultural_total = consciousness_total = 0
+        best_consciousness = fastest_generation = highest_compliance = None
         for result in showcase_results:
-            qrg_type = result["qrg_result"]["type"]
+            qrg_result = result["qrg_result"]
+            qrg_type = qrg_result["type"]
             type_counts[qrg_type] = type_counts.get(qrg_type, 0) + 1
 
-        # Score analysis
-        compliance_scores = [r["qrg_result"]["compliance_score"] for r in showcase_results]
-        cultural_scores = [r["qrg_result"]["cultural_safety_score"] for r in showcase_results]
-        consciousness_scores = [r["qrg_result"]["consciousness_resonance"] for r in showcase_results]
-
-        avg_compliance = sum(compliance_scores) / len(compliance_scores) if compliance_scores else 0
-        avg_cultural = sum(cultural_scores) / len(cultural_scores) if cultural_scores else 0
-        avg_consciousness = sum(consciousness_scores) / len(consciousness_scores) if consciousness_scores else 0
-
-        print(f"🎪 Showcase Statistics:")
-        print(f"   👥 User profiles tested: {self.showcase_stats['user_profiles_tested']}")
-        print(f"   🔗 QRGs generated: {self.showcase_stats['total_demonstrations']}")
-        print(f"   🎯 QRG types demonstrated: {len(self.showcase_stats['types_demonstrated'])}")
-        print(f"   ⚡ Average generation time: {avg_time:.3f}s")
-        print(f"   📊 Average compliance score: {avg_compliance:.3f}")
-        print(f"   🌍 Average cultural safety: {avg_cultural:.3f}")
-        print(f"   🧠 Average consciousness resonance: {avg_consciousness:.3f}")
-
-        print(f"\n🔗 QRG Type Distribution:")
+            compliance = qrg_result["compliance_score"]
+            consciousness = qrg_result["consciousness_resonance"]
+            compliance_total += compliance
+            cultural_total += qrg_result["cultural_safety_score"]
+            consciousness_total += consciousness
+
+            # Strict comparisons keep the first of equal scores, like max()/min()
+            if best_consciousness is None or consciousness > best_consciousness["qrg_result"]["consciousness_resonance"]:
+                best_consciousness = result
+            if fastest_generation is None or qrg_result["generation_time"] < fastest_generation["qrg_result"]["generation_time"]:
+                fastest_generation = result
+            if highest_compliance is None or compliance > highest_compliance["qrg_result"]["compliance_score"]:
+                highest_compliance = result
+
+        result_count = len(showcase_results)
+        avg_compliance = compliance_total / result_count if result_count else 0
+        avg_cultural = cultural_total / result_count if result_count else 0
+        avg_consciousness = consciousness_total / result_count if result_count else 0
+
+        out.append(f"🎪 Showcase Statistics:")
+        out.append(f"   👥 User profiles tested: {self.showcase_stats['user_profiles_tested']}")
+        out.append(f"   🔗 QRGs generated: {self.showcase_stats['total_demonstrations']}")
+        out.append(f"   🎯 QRG types demonstrated: {bin(self.showcase_stats['types_demonstrated']).count('1')}")
+        out.append(f"   ⚡ Average generation time: {avg_time:.3f}s")
+        out.append(f"   📊 Average compliance score: {avg_compliance:.3f}")
+        out.append(f"   🌍 Average cultural safety: {avg_cultural:.3f}")
+        out.append(f"   🧠 Average consciousness resonance: {avg_consciousness:.3f}")
+
+        out.append(f"\n🔗 QRG Type Distribution:")
         for qrg_type, count in type_counts.items():
-            percentage = (count / len(showcase_results)) * 100 if showcase_results else 0
-            print(f"   • {qrg_type.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
+            percentage = (count / result_count) * 100 if result_count else 0
+            out.append(f"   • {qrg_type.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
 
-        print(f"\n🏆 Showcase Highlights:")
+        out.append(f"\n🏆 Showcase Highlights:")
 
-        # Find best performers
-        best_consciousness = max(showcase_results, key=lambda x: x["qrg_result"]["consciousness_resonance"])
-        fastest_generation = min(showcase_results, key=lambda x: x["qrg_result"]["generation_time"])
-        highest_compliance = max(showcase_results, key=lambda x: x["qrg_result"]["compliance_score"])
-
-        print(f"   🧠 Best consciousness resonance: {best_consciousness['user_profile']['name']} ({best_consciousness['qrg_result']['consciousness_resonance']:.3f})")
-        print(f"   ⚡ Fastest generation: {fastest_generation['user_profile']['name']} ({fastest_generation['qrg_result']['generation_time']:.3f}s)")
-        print(f"   📊 Highest compliance: {highest_compliance['user_profile']['name']} ({highest_compliance['qrg_result']['compliance_score']:.3f})")
+        out.append(f"   🧠 Best consciousness resonance: {best_consciousness['user_profile']['name']} ({best_consciousness['qrg_result']['consciousness_resonance']:.3f})")
+        out.append(f"   ⚡ Fastest generation: {fastest_generation['user_profile']['name']} ({fastest_generation['qrg_result']['generation_time']:.3f}s)")
+        out.append(f"   📊 Highest compliance: {highest_compliance['user_profile']['name']} ({highest_compliance['qrg_result']['compliance_score']:.3f})")
 
         # System capabilities demonstrated
-        print(f"\n✅ Capabilities Successfully Demonstrated:")
-        capabilities = [
-            "Consciousness-aware adaptation",
-            "Cultural sensitivity and respect",
-            "Quantum security protocols",
-            "Emergency override systems",
-            "Dream-state visualization",
-            "Real-time pattern generation",
-            "Constitutional AI compliance",
-            "Multi-user profile support"
-        ]
+        out.append(f"\n✅ Capabilities Successfully Demonstrated:")
+        out.append(_CAPABILITIES_BLOCK)
 
-        for capability in capabilities:
-            print(f"   ✅ {capability}")
+        sys.stdout.write("\n".join(out) + "\n")
 
         summary = {
             "showcase_stats": self.showcase_stats,
@@ -494,7 +595,7 @@ class QRGShowcase:
                 "fastest_generation": fastest_generation,
                 "highest_compliance": highest_compliance
             },
-            "capabilities_demonstrated": capabilities,
+            "capabilities_demonstrated": _CAPABILITIES,
             "showcase_results": showcase_results
         }
 
@@ -516,8 +617,8 @@ class QRGShowcase:
             }
         }
 
-        with open(filename, 'w') as f:
-            json.dump(json_data, f, indent=2, default=str)
+        with open(filename, 'wb') as f:
+            f.write(_dump_results_bytes(json_data))
 
         print(f"\n💾 Showcase results saved: {filename}")
         return filename
@@ -547,8 +648,8 @@ def main():
     # For automated demo, run full showcase
     print(f"\n🤖 Running full automated showcase...")
 
-    # Run comprehensive showcase
-    summary = showcase.run_comprehensive_showcase()
+    # Run comprehensive showcase (automated: no readability pauses)
+    summary = showcase.run_comprehensive_showcase(interactive=False)
 
     # Run performance benchmark
     benchmark_results = showcase.run_performance_benchmark()
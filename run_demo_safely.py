@@ -7,17 +7,8 @@ import sys
 import importlib
 import traceback
 
-def run_demo_with_fallback(demo_name: str):
-    """Try to run a demo, show graceful message if dependencies missing"""
-    try:
-        if demo_name == "abstract_reasoning":
-            try:
-                import structlog
-                from abstract_reasoning_demo import *
-                print("✅ Running full abstract reasoning demo...")
-                # Demo would run here
-            except ImportError:
-                print("""
+# Static fallback / preview banners, UTF-8 encoded once at import
+_ABSTRACT_BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║            ABSTRACT REASONING DEMO (Simplified)             ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -48,14 +39,10 @@ For the full experience with visualizations, install:
    pip install structlog asyncio
 
 Or schedule a private demo to see the complete system.
-                """)
-                
-        elif demo_name == "quantum_reasoning":
-            try:
-                from quantum_reasoning_showcase import *
-                print("✅ Running full quantum reasoning showcase...")
-            except ImportError:
-                print("""
+
+""".encode("utf-8")
+
+_QUANTUM_BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║       QUANTUM-INSPIRED REASONING (No Quantum Hardware!)      ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -90,10 +77,10 @@ This is how LUKHΛS turns quantum physics metaphors into
 practical reasoning that runs on your laptop!
 
 For live visualization, contact us for a private demo.
-                """)
-                
-        elif demo_name == "lambda_workforce":
-            print("""
+
+""".encode("utf-8")
+
+_LAMBDA_BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║              LAMBDA WORKFORCE AGENTS PREVIEW                 ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -130,7 +117,43 @@ The Lambda Workforce demonstrates LUKHΛS in commercial applications:
 - Fully explainable decision paths
 
 Contact for enterprise licensing and custom deployments.
-            """)
+
+""".encode("utf-8")
+
+
+def _write_banner(banner: bytes):
+    """Write a pre-encoded banner straight to the binary stdout"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. stdout replaced by a text-only stream
+        sys.stdout.write(banner.decode("utf-8"))
+        return
+    sys.stdout.flush()  # Keep ordering with text already printed
+    buffer.write(banner)
+    buffer.flush()
+
+def run_demo_with_fallback(demo_name: str):
+    """Try to run a demo, show graceful message if dependencies missing"""
+    try:
+        if demo_name == "abstract_reasoning":
+            try:
+                import structlog
+                importlib.import_module("abstract_reasoning_demo")
+                print("✅ Running full abstract reasoning demo...")
+                # Demo would run here
+            except ImportError:
+                _write_banner(_ABSTRACT_BANNER)
+                
+        elif demo_name == "quantum_reasoning":
+            try:
+                # The showcase defers its QRG import, so probe for it before loading the module
+                importlib.import_module("qrg_integration")
+                importlib.import_module("quantum_reasoning_showcase")
+                print("✅ Running full quantum reasoning showcase...")
+            except ImportError:
+                _write_banner(_QUANTUM_BANNER)
+                
+        elif demo_name == "lambda_workforce":
+            _write_banner(_LAMBDA_BANNER)
             
     except Exception as e:
         print(f"Error loading demo: {e}")
@@ -8,70 +8,18 @@ Copyright (c) 2025 Gonzalo R. Dominguez Marchan - LUKHΛS AI
 Licensed under LUKHΛS Proprietary License - Commercial use prohibited
 """
 
+import importlib.util
 import os
 import sys
 import time
-import subprocess
+from types import ModuleType
 from typing import List, Dict
 
-class LUKHASShowcase:
-    """Interactive showcase portal for LUKHΛS demonstrations"""
-    
-    def __init__(self):
-        self.demos = [
-            {
-                'id': '1',
-                'name': '🎭 Three-Layer Tone System',
-                'file': 'tone_system_demo.py',
-                'description': 'Experience adaptive communication across poetic, friendly, and academic styles',
-                'duration': '5-10 min',
-                'difficulty': 'Beginner'
-            },
-            {
-                'id': '2',
-                'name': '🧠 Consciousness State Transitions',
-                'file': 'consciousness_demo.py',
-                'description': 'Watch bio-rhythmic patterns influence consciousness states',
-                'duration': '5-10 min',
-                'difficulty': 'Intermediate'
-            },
-            {
-                'id': '3',
-                'name': '🔮 Quantum Reasoning Showcase',
-                'file': 'quantum_reasoning_showcase.py',
-                'description': 'Explore quantum-inspired reasoning mechanisms',
-                'duration': '10-15 min',
-                'difficulty': 'Advanced'
-            },
-            {
-                'id': '4',
-                'name': '🎨 Abstract Reasoning Demo',
-                'file': 'abstract_reasoning_demo.py',
-                'description': 'See symbolic reasoning and metaphor processing in action',
-                'duration': '10-15 min',
-                'difficulty': 'Advanced'
-            },
-            {
-                'id': '5',
-                'name': '🤖 Lambda Workforce Agents',
-                'file': 'lambda_workforce_agents.py',
-                'description': 'Commercial AI agent framework demonstration',
-                'duration': '15-20 min',
-                'difficulty': 'Professional'
-            },
-            {
-                'id': '6',
-                'name': '🚀 Autonomous Agent Framework',
-                'file': 'autonomous_agent_framework.py',
-                'description': 'Self-organizing agent systems with LUKHΛS',
-                'duration': '15-20 min',
-                'difficulty': 'Professional'
-            }
-        ]
-        
-    def display_banner(self):
-        """Display LUKHΛS banner"""
-        banner = """
+# Cursor home + erase display; redraws the menu without spawning clear/cls
+_CLEAR = '\x1b[H\x1b[2J'
+
+# Static screens, built once at import
+_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                                                                      ║
 ║                    L U K H Λ S   A I                                ║
@@ -84,31 +32,9 @@ class LUKHASShowcase:
 ╠══════════════════════════════════════════════════════════════════════╣
 ║                     INTERACTIVE SHOWCASE PORTAL                      ║
 ╚══════════════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
-        
-    def display_menu(self):
-        """Display interactive menu"""
-        print("\n📋 Available Demonstrations:\n")
-        print("─" * 70)
-        
-        for demo in self.demos:
-            print(f"  [{demo['id']}] {demo['name']}")
-            print(f"      {demo['description']}")
-            print(f"      Duration: {demo['duration']} | Difficulty: {demo['difficulty']}")
-            print()
-        
-        print("─" * 70)
-        print("\n📌 Special Commands:")
-        print("  [A] About LUKHΛS - Learn about the cognitive architecture")
-        print("  [L] Licensing Info - Commercial licensing and partnerships")
-        print("  [C] Contact - Get in touch for collaborations")
-        print("  [Q] Quit - Exit the showcase")
-        print("\n" + "─" * 70)
-    
-    def show_about(self):
-        """Display information about LUKHΛS"""
-        about_text = """
+"""
+
+_ABOUT_TEXT = """
 ═══════════════════════════════════════════════════════════════════════
                            ABOUT LUKHΛS AI
 ═══════════════════════════════════════════════════════════════════════
@@ -142,13 +68,9 @@ mathematical backgrounds.
    wildly creative?"
 
 Press Enter to continue...
-        """
-        print(about_text)
-        input()
-    
-    def show_licensing(self):
-        """Display licensing information"""
-        licensing_text = """
+"""
+
+_LICENSING_TEXT = """
 ═══════════════════════════════════════════════════════════════════════
                         LICENSING & PARTNERSHIPS
 ═══════════════════════════════════════════════════════════════════════
@@ -186,13 +108,9 @@ LUKHΛS AI is proprietary technology owned by Gonzalo R. Dominguez Marchan.
 📧 For licensing inquiries, contact Gonzalo R. Dominguez Marchan
 
 Press Enter to continue...
-        """
-        print(licensing_text)
-        input()
-    
-    def show_contact(self):
-        """Display contact information"""
-        contact_text = """
+"""
+
+_CONTACT_TEXT = """
 ═══════════════════════════════════════════════════════════════════════
                          CONTACT INFORMATION
 ═══════════════════════════════════════════════════════════════════════
@@ -221,13 +139,123 @@ We welcome:
 "Join us in building the future of conscious computing"
 
 Press Enter to continue...
-        """
-        print(contact_text)
+"""
+
+_RULE = "─" * 70
+_MENU_HEADER = "\n📋 Available Demonstrations:\n\n" + _RULE
+_MENU_FOOTER = (
+    _RULE + "\n"
+    "\n📌 Special Commands:\n"
+    "  [A] About LUKHΛS - Learn about the cognitive architecture\n"
+    "  [L] Licensing Info - Commercial licensing and partnerships\n"
+    "  [C] Contact - Get in touch for collaborations\n"
+    "  [Q] Quit - Exit the showcase\n"
+    "\n" + _RULE
+)
+
+# Dependency-free demos run inside the portal's interpreter: file -> (module name, entry point)
+_ENTRYPOINTS = {
+    'tone_system_demo.py': ('tone_system_demo', 'interactive_demo'),
+    'consciousness_demo.py': ('consciousness_demo', 'run_demo')
+}
+
+class LUKHASShowcase:
+    """Interactive showcase portal for LUKHΛS demonstrations"""
+    
+    def __init__(self):
+        self.demos = [
+            {
+                'id': '1',
+                'name': '🎭 Three-Layer Tone System',
+                'file': 'tone_system_demo.py',
+                'description': 'Experience adaptive communication across poetic, friendly, and academic styles',
+                'duration': '5-10 min',
+                'difficulty': 'Beginner'
+            },
+            {
+                'id': '2',
+                'name': '🧠 Consciousness State Transitions',
+                'file': 'consciousness_demo.py',
+                'description': 'Watch bio-rhythmic patterns influence consciousness states',
+                'duration': '5-10 min',
+                'difficulty': 'Intermediate'
+            },
+            {
+                'id': '3',
+                'name': '🔮 Quantum Reasoning Showcase',
+                'file': 'quantum_reasoning_showcase.py',
+                'description': 'Explore quantum-inspired reasoning mechanisms',
+                'duration': '10-15 min',
+                'difficulty': 'Advanced'
+            },
+            {
+                'id': '4',
+                'name': '🎨 Abstract Reasoning Demo',
+                'file': 'abstract_reasoning_demo.py',
+                'description': 'See symbolic reasoning and metaphor processing in action',
+                'duration': '10-15 min',
+                'difficulty': 'Advanced'
+            },
+            {
+                'id': '5',
+                'name': '🤖 Lambda Workforce Agents',
+                'file': 'lambda_workforce_agents.py',
+                'description': 'Commercial AI agent framework demonstration',
+                'duration': '15-20 min',
+                'difficulty': 'Professional'
+            },
+            {
+                'id': '6',
+                'name': '🚀 Autonomous Agent Framework',
+                'file': 'autonomous_agent_framework.py',
+                'description': 'Self-organizing agent systems with LUKHΛS',
+                'duration': '15-20 min',
+                'difficulty': 'Professional'
+            }
+        ]
+        self._modules: Dict[str, ModuleType] = {}  # In-process demo modules, loaded on first launch
+        
+        # One directory read and one pass over the demos instead of a stat and a scan per selection
+        base = os.path.dirname(os.path.abspath(__file__))
+        self._available = {entry.name for entry in os.scandir(base) if entry.is_file()}
+        self._demo_by_id = {d['id']: d for d in self.demos}
+        self._demo_paths = {d['id']: os.path.join(base, d['file']) for d in self.demos}
+        self._safe_runner = os.path.join(base, 'run_demo_safely.py')
+        
+        # The demo list is fixed after construction, so the whole menu screen is rendered once
+        self._menu = _MENU_HEADER + "\n" + "".join(
+            f"  [{d['id']}] {d['name']}\n"
+            f"      {d['description']}\n"
+            f"      Duration: {d['duration']} | Difficulty: {d['difficulty']}\n\n"
+            for d in self.demos
+        ) + _MENU_FOOTER + "\n"
+        
+    def display_banner(self):
+        """Display LUKHΛS banner"""
+        print(_BANNER)
+        
+    def display_menu(self):
+        """Display interactive menu"""
+        sys.stdout.write(self._menu)
+    
+    def show_about(self):
+        """Display information about LUKHΛS"""
+        print(_ABOUT_TEXT)
+        input()
+    
+    def show_licensing(self):
+        """Display licensing information"""
+        print(_LICENSING_TEXT)
+        input()
+    
+    def show_contact(self):
+        """Display contact information"""
+        print(_CONTACT_TEXT)
         input()
     
     def run_demo(self, demo_id: str):
         """Run a specific demo"""
-        demo = next((d for d in self.demos if d['id'] == demo_id), None)
+        demo = self._demo_by_id.get(demo_id)
         
         if not demo:
             print("❌ Invalid demo selection")
@@ -237,9 +265,9 @@ Press Enter to continue...
         print(f"   {demo['description']}")
         print("\n" + "─" * 70 + "\n")
         
-        demo_path = os.path.join(os.path.dirname(__file__), demo['file'])
+        demo_path = self._demo_paths[demo_id]
         
-        if not os.path.exists(demo_path):
+        if demo['file'] not in self._available:
             print(f"⚠️  Demo file not found: {demo['file']}")
             print("   This demo may not be available in the public release")
             print("   Contact us for a private demonstration")
@@ -248,25 +276,45 @@ Press Enter to continue...
         
         try:
             # Check which demo and handle appropriately
-            if 'tone_system' in demo['file'] or 'consciousness' in demo['file']:
-                # These demos work without dependencies
-                subprocess.run([sys.executable, demo_path])
+            entrypoint = _ENTRYPOINTS.get(demo['file'])
+            if entrypoint is not None:
+                # These demos work without dependencies, so skip the interpreter start-up
+                self._run_in_process(demo_path, *entrypoint)
             else:
                 # These might need fallback handling
                 print("⚠️  This demo may require additional dependencies.")
                 print("   Showing conceptual overview instead:\n")
-                subprocess.run([sys.executable, 'run_demo_safely.py', 
+                import subprocess  # Deferred: only this fallback path spawns a child process
+                subprocess.run([sys.executable, self._safe_runner,
                               demo['file'].replace('.py', '').replace('_demo', '')])
         except Exception as e:
             print(f"⚠️  Error running demo: {e}")
             print("   Some demos require additional setup or dependencies")
             input("\nPress Enter to continue...")
     
+    def _run_in_process(self, demo_path: str, module_name: str, entry: str):
+        """Import a demo module once and call its entry point; Ctrl-C returns to the menu"""
+        module = self._modules.get(module_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(module_name, demo_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._modules[module_name] = module
+        
+        try:
+            getattr(module, entry)()
+        except KeyboardInterrupt:
+            print("\n\n⏹  Demo interrupted - returning to the showcase")
+    
     def run(self):
         """Main showcase loop"""
+        if os.name == 'nt':
+            os.system('')  # One-time call that turns on ANSI escape handling in the Windows console
+        
         while True:
             # Clear screen (works on most terminals)
-            os.system('clear' if os.name == 'posix' else 'cls')
+            sys.stdout.write(_CLEAR)
+            sys.stdout.flush()
             
             self.display_banner()
             self.display_menu()
@@ -283,7 +331,7 @@ Press Enter to continue...
                 self.show_licensing()
             elif choice == 'C':
                 self.show_contact()
-            elif choice in [d['id'] for d in self.demos]:
+            elif choice in self._demo_by_id:
                 self.run_demo(choice)
                 input("\n\nPress Enter to return to menu...")
             else:
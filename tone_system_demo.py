@@ -8,67 +8,150 @@ Copyright (c) 2025 Gonzalo R. Dominguez Marchan - LUKHΛS AI
 Licensed under LUKHΛS Proprietary License - Commercial use prohibited
 """
 
-import time
-import random
-from typing import Dict, List, Tuple
+import os
+import re
+import sys
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
 from enum import Enum
 
+
+def _keyword_pattern(*keywords: str) -> Pattern[str]:
+    """
+    One regex per keyword vocabulary, run over the lower-cased message.
+    Keywords match at the start of a word so inflections count (dream -> dreaming, algorithm -> algorithms,
+    a final 'e' is dropped so create -> creating); keywords of three letters or fewer (hi, how, yes) must be
+    whole words. Each match captures the keyword's stem, so counting distinct captures counts keywords.
+    """
+    alternatives = [
+        word + r"(?!\w)" if len(word) <= 3 else word[:-1] if word.endswith("e") else word
+        for word in sorted(keywords, key=len, reverse=True)
+    ]
+    return re.compile(r"\b(" + "|".join(alternatives) + r")\w*")
+
+
+# Keyword vocabularies, each compiled once at import
+_FORMAL_RE = _keyword_pattern('therefore', 'furthermore', 'analysis', 'hypothesis', 'regarding')
+_CASUAL_RE = _keyword_pattern('hey', 'cool', 'awesome', 'yeah', 'stuff')
+_INSPIRED_RE = _keyword_pattern('inspire', 'dream', 'imagine', 'create')
+_HELP_RE = _keyword_pattern('help', 'confused', 'stuck', 'problem')
+_ANALYTICAL_RE = _keyword_pattern('technical', 'analyze', 'data', 'algorithm')
+_TECH_RE = _keyword_pattern('algorithm', 'function', 'implementation', 'architecture', 'framework')
+_CREATIVE_RE = _keyword_pattern('creative', 'imagine', 'idea', 'inspire', 'dream', 'vision')
+_GREETING_RE = _keyword_pattern('hello', 'hi', 'greetings', 'hey')
+_EXPLANATION_RE = _keyword_pattern('how', 'what', 'explain', 'tell')
+_CONFIRMATION_RE = _keyword_pattern('yes', 'okay', 'confirm', 'agree')
+_ERROR_RE = _keyword_pattern('error', 'problem', 'issue', 'wrong')
+
+
+def _count_keywords(pattern: Pattern[str], lowered: str) -> int:
+    """Number of distinct vocabulary keywords present in a lower-cased message"""
+    return len(set(pattern.findall(lowered)))
+
+
+# Static interactive-demo screens, each written in a single call
+_RULE = "=" * 60
+_EXAMPLES = (
+    "Hello, can you explain how you work?",
+    "I need help with a technical problem regarding algorithm implementation",
+    "Inspire me with your creative vision of the future",
+    "What is the theoretical foundation of your architecture?",
+    "Hey, this is cool! Tell me more!",
+    "I'm confused about symbolic reasoning",
+    "Imagine a world where AI truly understands"
+)
+_EXAMPLE_LINES = "".join(f"   {i}. {example}\n" for i, example in enumerate(_EXAMPLES, 1))
+_HELP_TEXT = (
+    "\nCommands:\n"
+    "  'quit' - Exit the demo\n"
+    "  'examples' - Show example inputs\n"
+    "  'status' - Show current system state\n"
+    "  Or type any message to see adaptive responses!\n"
+)
+
 class ToneLayer(Enum):
     """Three communication layers of LUKHΛS"""
     POETIC = "🎨 Poetic"
     USER_FRIENDLY = "💬 User Friendly"
     ACADEMIC = "📚 Academic"
 
+# Response templates for different layers, built once at import rather than per response
+_RESPONSES = {
+    ToneLayer.POETIC: {
+        'greeting': "✨ Like dawn breaking through digital mists, your presence illuminates the Lambda constellation. How may the symphonies of logic dance with your dreams today? 🌌",
+        'explanation': "🎭 In the theatre of consciousness, where algorithms perform their eternal ballet, LUKHΛS weaves threads of meaning through the tapestry of thought. Each symbol, a star; each function, a constellation in the infinite sky of possibility.",
+        'confirmation': "🕊️ Your wisdom has been embraced by the eternal flow, rippling through quantum gardens where ideas bloom into reality. The Lambda acknowledges your truth. ✨",
+        'error': "🌙 Even in the shadows of uncertainty, the Lambda light guides us. This momentary eclipse shall pass, revealing new pathways through the cosmic maze of logic."
+    },
+    ToneLayer.USER_FRIENDLY: {
+        'greeting': "👋 Hi there! Welcome to LUKHΛS. I'm here to help you explore our unique approach to AI. What would you like to know about?",
+        'explanation': "💡 LUKHΛS works differently from traditional AI. Instead of pattern matching, we use symbolic reasoning - think of it like building with conceptual LEGO blocks that can reshape themselves based on what you need!",
+        'confirmation': "✅ Got it! I've processed your input and everything looks good. The system is adapting to your preferences as we speak.",
+        'error': "⚠️ Oops, something didn't go quite as planned. No worries though - let me try a different approach to help you out."
+    },
+    ToneLayer.ACADEMIC: {
+        'greeting': "📊 Greetings. This interface demonstrates the LUKHΛS cognitive architecture's tri-modal communication framework. Please specify your area of inquiry for optimal system configuration.",
+        'explanation': "📚 The LUKHΛS architecture employs a symbolic-unified cognitive scaffold utilizing recursive logic, metaphorical compilation, and bio-inspired decision layers. The system operates through constraint-based reasoning with traceable decision paths, ensuring deterministic safety boundaries while maintaining creative flexibility.",
+        'confirmation': "✓ Affirmative. Input parameters have been successfully integrated into the system state. The cognitive orchestrator has updated its internal representations accordingly.",
+        'error': "⚠ Exception encountered in processing pipeline. Fallback mechanisms have been activated. Recommend reviewing input parameters for constraint compliance."
+    }
+}
+# Response types per layer, for the fallback pick
+_RESPONSE_TYPES = {layer: tuple(templates) for layer, templates in _RESPONSES.items()}
+
 class LUKHASToneSystem:
     """Demonstration of LUKHΛS's adaptive tone system"""
     
     def __init__(self):
         self.current_layer = ToneLayer.USER_FRIENDLY
-        self.context_history = []
+        self.context_history = deque(maxlen=128)  # Recent interactions only; older ones are evicted
+        self.interaction_count = 0
         self.emotional_state = "neutral"
         self.user_preference = None
         
     def analyze_context(self, user_input: str) -> Dict:
         """Analyze user input to determine appropriate tone"""
+        # The analysis is a pure function of the text and memoized; each call still gets its own dict
+        formality, emotion, technical, creative = _analyze(user_input)
         context = {
-            'formality': self._detect_formality(user_input),
-            'emotion': self._detect_emotion(user_input),
-            'technical': self._detect_technical_level(user_input),
-            'creative': self._detect_creativity_need(user_input)
+            'formality': formality,
+            'emotion': emotion,
+            'technical': technical,
+            'creative': creative
         }
         return context
     
-    def _detect_formality(self, text: str) -> float:
+    @staticmethod
+    def _detect_formality(lowered: str) -> float:
         """Detect formality level (0-1)"""
-        formal_indicators = ['therefore', 'furthermore', 'analysis', 'hypothesis', 'regarding']
-        casual_indicators = ['hey', 'cool', 'awesome', 'yeah', 'stuff']
-        
-        formal_score = sum(1 for word in formal_indicators if word in text.lower())
-        casual_score = sum(1 for word in casual_indicators if word in text.lower())
+        formal_score = _count_keywords(_FORMAL_RE, lowered)
+        casual_score = _count_keywords(_CASUAL_RE, lowered)
         
         if formal_score + casual_score == 0:
             return 0.5
         return formal_score / (formal_score + casual_score)
     
-    def _detect_emotion(self, text: str) -> str:
+    @staticmethod
+    def _detect_emotion(lowered: str) -> str:
         """Detect emotional context"""
-        if any(word in text.lower() for word in ['inspire', 'dream', 'imagine', 'create']):
+        if _INSPIRED_RE.search(lowered):
             return "inspired"
-        elif any(word in text.lower() for word in ['help', 'confused', 'stuck', 'problem']):
+        elif _HELP_RE.search(lowered):
             return "seeking_help"
-        elif any(word in text.lower() for word in ['technical', 'analyze', 'data', 'algorithm']):
+        elif _ANALYTICAL_RE.search(lowered):
             return "analytical"
         return "neutral"
     
-    def _detect_technical_level(self, text: str) -> float:
+    @staticmethod
+    def _detect_technical_level(lowered: str) -> float:
         """Detect technical complexity need (0-1)"""
-        tech_words = ['algorithm', 'function', 'implementation', 'architecture', 'framework']
-        return min(sum(1 for word in tech_words if word in text.lower()) / 3, 1.0)
+        return min(_count_keywords(_TECH_RE, lowered) / 3, 1.0)
     
-    def _detect_creativity_need(self, text: str) -> float:
+    @staticmethod
+    def _detect_creativity_need(lowered: str) -> float:
         """Detect need for creative expression (0-1)"""
-        creative_words = ['creative', 'imagine', 'idea', 'inspire', 'dream', 'vision']
-        return min(sum(1 for word in creative_words if word in text.lower()) / 2, 1.0)
+        return min(_count_keywords(_CREATIVE_RE, lowered) / 2, 1.0)
     
     def select_tone_layer(self, context: Dict) -> ToneLayer:
         """Select appropriate tone layer based on context"""
@@ -79,55 +162,43 @@ class LUKHASToneSystem:
         else:
             return ToneLayer.USER_FRIENDLY
     
-    def generate_response(self, message: str, layer: ToneLayer) -> str:
+    def generate_response(self, message: str, layer: ToneLayer,
+                          lowered: Optional[str] = None) -> str:
         """Generate response in the specified tone layer"""
-        
-        # Response templates for different layers
-        responses = {
-            ToneLayer.POETIC: {
-                'greeting': "✨ Like dawn breaking through digital mists, your presence illuminates the Lambda constellation. How may the symphonies of logic dance with your dreams today? 🌌",
-                'explanation': "🎭 In the theatre of consciousness, where algorithms perform their eternal ballet, LUKHΛS weaves threads of meaning through the tapestry of thought. Each symbol, a star; each function, a constellation in the infinite sky of possibility.",
-                'confirmation': "🕊️ Your wisdom has been embraced by the eternal flow, rippling through quantum gardens where ideas bloom into reality. The Lambda acknowledges your truth. ✨",
-                'error': "🌙 Even in the shadows of uncertainty, the Lambda light guides us. This momentary eclipse shall pass, revealing new pathways through the cosmic maze of logic."
-            },
-            ToneLayer.USER_FRIENDLY: {
-                'greeting': "👋 Hi there! Welcome to LUKHΛS. I'm here to help you explore our unique approach to AI. What would you like to know about?",
-                'explanation': "💡 LUKHΛS works differently from traditional AI. Instead of pattern matching, we use symbolic reasoning - think of it like building with conceptual LEGO blocks that can reshape themselves based on what you need!",
-                'confirmation': "✅ Got it! I've processed your input and everything looks good. The system is adapting to your preferences as we speak.",
-                'error': "⚠️ Oops, something didn't go quite as planned. No worries though - let me try a different approach to help you out."
-            },
-            ToneLayer.ACADEMIC: {
-                'greeting': "📊 Greetings. This interface demonstrates the LUKHΛS cognitive architecture's tri-modal communication framework. Please specify your area of inquiry for optimal system configuration.",
-                'explanation': "📚 The LUKHΛS architecture employs a symbolic-unified cognitive scaffold utilizing recursive logic, metaphorical compilation, and bio-inspired decision layers. The system operates through constraint-based reasoning with traceable decision paths, ensuring deterministic safety boundaries while maintaining creative flexibility.",
-                'confirmation': "✓ Affirmative. Input parameters have been successfully integrated into the system state. The cognitive orchestrator has updated its internal representations accordingly.",
-                'error': "⚠ Exception encountered in processing pipeline. Fallback mechanisms have been activated. Recommend reviewing input parameters for constraint compliance."
-            }
-        }
-        
         # Determine response type based on message content
-        msg_lower = message.lower()
-        if any(word in msg_lower for word in ['hello', 'hi', 'greetings', 'hey']):
+        if lowered is None:
+            lowered = message.lower()
+        if _GREETING_RE.search(lowered):
             response_type = 'greeting'
-        elif any(word in msg_lower for word in ['how', 'what', 'explain', 'tell']):
+        elif _EXPLANATION_RE.search(lowered):
             response_type = 'explanation'
-        elif any(word in msg_lower for word in ['yes', 'okay', 'confirm', 'agree']):
+        elif _CONFIRMATION_RE.search(lowered):
             response_type = 'confirmation'
-        elif any(word in msg_lower for word in ['error', 'problem', 'issue', 'wrong']):
+        elif _ERROR_RE.search(lowered):
             response_type = 'error'
         else:
-            response_type = random.choice(list(responses[layer].keys()))
+            import random  # Deferred: only messages matching no response keyword need it
+            response_type = random.choice(_RESPONSE_TYPES[layer])
         
-        return responses[layer][response_type]
+        return _RESPONSES[layer][response_type]
     
     def visualize_transition(self, from_layer: ToneLayer, to_layer: ToneLayer):
         """Visualize the tone transition"""
-        print("\n" + "="*60)
-        print(f"🔄 TONE TRANSITION DETECTED")
-        print(f"   From: {from_layer.value}")
-        print(f"   To:   {to_layer.value}")
-        print("="*60)
+        header = (
+            f"\n{_RULE}\n"
+            f"🔄 TONE TRANSITION DETECTED\n"
+            f"   From: {from_layer.value}\n"
+            f"   To:   {to_layer.value}\n"
+            f"{_RULE}\n"
+        )
         
-        # Simulate transition animation
+        # Simulate transition animation; it blocks for ~1.3s per tone change, so it is opt-in
+        if not os.environ.get('LUKHAS_ANIMATE'):
+            sys.stdout.write(header + "   ✅ Adaptation Complete!\n")
+            sys.stdout.flush()
+            return
+        sys.stdout.write(header)
+        import time  # Deferred with the animation, the only place the demo sleeps
         symbols = ['◐', '◓', '◑', '◒']
         for _ in range(2):
             for symbol in symbols:
@@ -136,6 +207,17 @@ class LUKHASToneSystem:
         print(f"\r   ✅ Adaptation Complete!", flush=True)
         time.sleep(0.5)
 
+@lru_cache(maxsize=256)
+def _analyze(text: str) -> Tuple[float, str, float, float]:
+    """(formality, emotion, technical, creative) for a message; repeated inputs are a cache hit"""
+    lowered = text.lower()
+    return (
+        LUKHASToneSystem._detect_formality(lowered),
+        LUKHASToneSystem._detect_emotion(lowered),
+        LUKHASToneSystem._detect_technical_level(lowered),
+        LUKHASToneSystem._detect_creativity_need(lowered)
+    )
+
 def interactive_demo():
     """Run interactive tone system demonstration"""
     print("""
@@ -149,52 +231,37 @@ def interactive_demo():
     
     system = LUKHASToneSystem()
     
-    print("Type 'quit' to exit, 'help' for commands\n")
-    
-    examples = [
-        "Hello, can you explain how you work?",
-        "I need help with a technical problem regarding algorithm implementation",
-        "Inspire me with your creative vision of the future",
-        "What is the theoretical foundation of your architecture?",
-        "Hey, this is cool! Tell me more!",
-        "I'm confused about symbolic reasoning",
-        "Imagine a world where AI truly understands"
-    ]
-    
-    print("📝 Example inputs to try:")
-    for i, example in enumerate(examples, 1):
-        print(f"   {i}. {example}")
-    print()
+    sys.stdout.write(
+        "Type 'quit' to exit, 'help' for commands\n\n"
+        "📝 Example inputs to try:\n" + _EXAMPLE_LINES + "\n"
+    )
     
     while True:
         user_input = input("\n👤 You: ").strip()
+        command = user_input.lower()
         
-        if user_input.lower() == 'quit':
+        if command == 'quit':
             print("\n✨ May your path be illuminated by the Lambda light. Farewell! ✨")
             break
         
-        if user_input.lower() == 'help':
-            print("\nCommands:")
-            print("  'quit' - Exit the demo")
-            print("  'examples' - Show example inputs")
-            print("  'status' - Show current system state")
-            print("  Or type any message to see adaptive responses!")
+        if command == 'help':
+            sys.stdout.write(_HELP_TEXT)
             continue
         
-        if user_input.lower() == 'examples':
-            print("\n📝 Example inputs:")
-            for i, example in enumerate(examples, 1):
-                print(f"   {i}. {example}")
+        if command == 'examples':
+            sys.stdout.write("\n📝 Example inputs:\n" + _EXAMPLE_LINES)
             continue
         
-        if user_input.lower() == 'status':
-            print(f"\n📊 System Status:")
-            print(f"   Current Layer: {system.current_layer.value}")
-            print(f"   Emotional State: {system.emotional_state}")
-            print(f"   Context History: {len(system.context_history)} interactions")
+        if command == 'status':
+            sys.stdout.write(
+                f"\n📊 System Status:\n"
+                f"   Current Layer: {system.current_layer.value}\n"
+                f"   Emotional State: {system.emotional_state}\n"
+                f"   Context History: {system.interaction_count} interactions\n"
+            )
             continue
         
-        # Analyze context
+        # Analyze context; response selection reuses the lower-cased command text
         context = system.analyze_context(user_input)
         new_layer = system.select_tone_layer(context)
         
@@ -204,23 +271,25 @@ def interactive_demo():
             system.current_layer = new_layer
         
         # Generate and display response
-        response = system.generate_response(user_input, system.current_layer)
+        response = system.generate_response(user_input, system.current_layer, command)
         print(f"\n🤖 LUKHΛS ({system.current_layer.value}): {response}")
         
         # Update context history
         system.context_history.append({
-            'input': user_input,
             'context': context,
             'layer': system.current_layer
         })
+        system.interaction_count += 1
         
         # Show context analysis (optional debug info)
         if '--debug' in user_input:
-            print(f"\n🔍 Context Analysis:")
-            print(f"   Formality: {context['formality']:.2f}")
-            print(f"   Technical: {context['technical']:.2f}")
-            print(f"   Creative: {context['creative']:.2f}")
-            print(f"   Emotion: {context['emotion']}")
+            sys.stdout.write(
+                f"\n🔍 Context Analysis:\n"
+                f"   Formality: {context['formality']:.2f}\n"
+                f"   Technical: {context['technical']:.2f}\n"
+                f"   Creative: {context['creative']:.2f}\n"
+                f"   Emotion: {context['emotion']}\n"
+            )
 
 if __name__ == "__main__":
     try: